@@ -2,15 +2,88 @@
 
 Implements shell command execution functionality.
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Coroutine, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shlex
 import subprocess
 import tempfile
 from pathlib import Path
+from pydantic import TypeAdapter
 
 from pipeline_orchestrator.handlers.extension import ExtensionHandler
-from pipeline_orchestrator.helpers.resources import ResourceDownloader
-from pipeline_orchestrator.helpers.containers import ContainerRunner
-from .models import ShellConfig
+from pipeline_orchestrator.helpers.resources import CachedResourceDownloader, copy_file
+from pipeline_orchestrator.helpers.containers import ContainerRunner, ContainerSession
+from .models import ShellConfig, ShellScript
+
+# Upper bound on configurations running their commands at the same time
+MAX_CONCURRENT_CONFIGS = (os.cpu_count() or 1) * 2
+
+# Only the tail of a command's output is kept and exported
+OUTPUT_TAIL_BYTES = 64 * 1024
+
+# Characters that need a shell to interpret the command
+SHELL_SYNTAX = re.compile(r'[|&;<>()$`\\"\'*?\[\]{}#~=%!\n]')
+
+# Commands that only exist inside a shell
+SHELL_BUILTINS = frozenset({
+    '.', ':', 'alias', 'bg', 'break', 'builtin', 'case', 'cd', 'command', 'continue',
+    'declare', 'do', 'done', 'elif', 'else', 'esac', 'eval', 'exec', 'exit', 'export',
+    'fg', 'fi', 'for', 'function', 'getopts', 'hash', 'if', 'jobs', 'let', 'local',
+    'readonly', 'read', 'return', 'select', 'set', 'shift', 'source', 'then', 'time',
+    'trap', 'type', 'typeset', 'ulimit', 'umask', 'unalias', 'unset', 'until', 'wait',
+    'while'
+})
+
+# A command line for the shell, or an argument vector to execute directly
+Command = Union[str, List[str]]
+
+# A command with the stable text naming it in resources and outputs
+LabeledCommand = Tuple[str, Command]
+
+# Validator for a whole list of shell configurations
+SHELL_CONFIGS_ADAPTER = TypeAdapter(List[ShellConfig])
+
+def command_text(command: Command) -> str:
+    """Get the shell form of a command"""
+    return command if isinstance(command, str) else shlex.join(command)
+
+def command_argv(command: Command) -> Optional[List[str]]:
+    """Get the argument vector of a command that does not need a shell"""
+    if isinstance(command, list):
+        return command
+    if SHELL_SYNTAX.search(command):
+        return None
+    argv = shlex.split(command)
+    if not argv or argv[0] in SHELL_BUILTINS:
+        return None
+    return argv
+
+def container_image(config: ShellConfig) -> Optional[str]:
+    """Get the image a configuration's commands run in, if isolated in a container"""
+    if config.isolation and config.isolation.type == "container":
+        return config.isolation.base_image or ContainerRunner.DEFAULT_IMAGE
+    return None
+
+def run_coroutine(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion from synchronous code
+    
+    Pulumi runs the program inside its own event loop, so when a loop is
+    already running the coroutine is driven by a fresh loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+    return asyncio.run(coroutine)
 
 class ShellExtension(ExtensionHandler):
     """Shell extension for executing shell commands and scripts
@@ -25,60 +98,258 @@ class ShellExtension(ExtensionHandler):
         super().__init__()
         self.configs: Optional[List[ShellConfig]] = []
     
-    def execute_command(self, config: ShellConfig, command: str) -> None:
+    async def execute_command(
+        self,
+        config: ShellConfig,
+        command: Command,
+        session: Optional[ContainerSession] = None
+    ) -> subprocess.CompletedProcess:
         """Execute a shell command
         
+        Only performs the process I/O, so it is safe to run off the Pulumi
+        thread. Commands without shell syntax are executed directly instead
+        of through /bin/sh.
+        
         Args:
             config: Shell configuration for this command
-            command: Command to execute
-        """
-        # Create command resource with proper naming
-        command_name = f"command.{config.name}.{hash(command) & 0xFFFFFFFF:08x}"
-        command_resource = self.create_resource(
-            f'shell:command:{config.name}',
-            command_name,
-            props={
-                'command': command,
-                'shell_type': config.type,
-                'isolation': config.isolation.model_dump() if config.isolation else None,
-                'config_name': config.name
-            }
-        )
+            command: Command line or argument vector to execute
+            session: Container to execute the command in, if isolated
+        
+        Returns:
+            CompletedProcess instance with command output
         
+        Raises:
+            subprocess.CalledProcessError: If the command exits non-zero
+        """
+        if session:
+            # Execute in the configuration's container
+            argv = session.exec_args(command_text(command))
+        else:
+            # Execute on host
+            argv = command_argv(command)
         try:
-            # Execute in container if isolation is configured
-            if config.isolation and config.isolation.type == "container":
-                result = ContainerRunner.run(
-                    command,
-                    config.isolation.base_image or "ubuntu:22.04"
+            if argv:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
                 )
             else:
-                # Execute on host
-                result = subprocess.run(
+                process = await asyncio.create_subprocess_shell(
                     command,
-                    shell=True,
-                    check=True,
-                    capture_output=True,
-                    text=True
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
                 )
+        except OSError as e:
+            # Report like the shell would for a missing or non-executable program
+            returncode = 127 if isinstance(e, FileNotFoundError) else 126
+            raise subprocess.CalledProcessError(returncode, command, "", str(e))
+        stdout, stderr = await asyncio.gather(
+            self.read_output(process.stdout),
+            self.read_output(process.stderr)
+        )
+        await process.wait()
+        
+        result = subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+        result.check_returncode()
+        return result
+    
+    async def read_output(self, stream: asyncio.StreamReader) -> str:
+        """Read a process output stream as it is produced
+        
+        Output is logged at debug level while streaming, and only the last
+        OUTPUT_TAIL_BYTES are kept in memory.
+        
+        Returns:
+            Tail of the stream output
+        """
+        tail = bytearray()
+        while chunk := await stream.read(OUTPUT_TAIL_BYTES):
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for line in chunk.decode(errors='replace').splitlines():
+                    self.logger.debug(line)
+            tail += chunk
+            if len(tail) > OUTPUT_TAIL_BYTES:
+                del tail[:-OUTPUT_TAIL_BYTES]
+        return tail.decode(errors='replace')
+    
+    async def execute_config_commands(
+        self,
+        config: ShellConfig,
+        commands: List[Command],
+        semaphore: asyncio.Semaphore,
+        session: Optional[ContainerSession] = None
+    ) -> List[Any]:
+        """Execute the commands of one configuration in order
+        
+        Stops at the first command that exits non-zero.
+        
+        Args:
+            config: Shell configuration of the commands
+            commands: Commands to execute, in order
+            semaphore: Bounds the number of concurrently running configurations
+            session: Container to execute the commands in, if isolated
             
-            # Store and export command output
-            output_data = {
-                'command': command,
-                'output': result.stdout.strip(),
-                'exit_code': result.returncode
-            }
-            self.export_output(f'{config.name}_output', output_data, command_resource)
+        Returns:
+            One CompletedProcess per command that ran, with the
+            CalledProcessError of the failed command last
+        """
+        results: List[Any] = []
+        async with semaphore:
+            for command in commands:
+                try:
+                    results.append(await self.execute_command(config, command, session))
+                except subprocess.CalledProcessError as e:
+                    results.append(e)
+                    break
+        return results
+    
+    async def execute_commands(
+        self,
+        commands: List[Tuple[ShellConfig, List[LabeledCommand]]],
+        sessions: Dict[Tuple[str, str], ContainerSession]
+    ) -> List[Any]:
+        """Execute the commands of each configuration, configurations concurrently
+        
+        Args:
+            commands: Shell configuration and its labeled commands to execute, in order
+            sessions: Containers by configuration name and image
             
-        except subprocess.CalledProcessError as e:
-            # Store and export error data
-            error_data = {
-                'command': command,
-                'error': e.stderr,
-                'exit_code': e.returncode
-            }
-            self.export_output(f'{config.name}_error', error_data, command_resource)
-            raise
+        Returns:
+            The results of execute_config_commands or an exception per
+            configuration, in input order
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONFIGS)
+        return await asyncio.gather(
+            *(
+                self.execute_config_commands(
+                    config,
+                    [command for _, command in config_commands],
+                    semaphore,
+                    sessions.get((config.name, container_image(config)))
+                )
+                for config, config_commands in commands
+            ),
+            return_exceptions=True
+        )
+    
+    def download_scripts(self, downloads: List[Tuple[ShellConfig, ShellScript, Path]]) -> List[Path]:
+        """Download scripts in parallel
+        
+        Args:
+            downloads: Shell configuration, script and target path per script
+            
+        Returns:
+            Path of each downloaded script, in input order
+        """
+        # Create target directory structure if needed
+        for target_path in {target_path.parent for _, _, target_path in downloads}:
+            target_path.mkdir(parents=True, exist_ok=True)
+            
+        # Download scripts with auth if configured
+        return CachedResourceDownloader.download_many([
+            (script.location, target_path, script.auth)
+            for _, script, target_path in downloads
+        ])
+    
+    def stage_script(self, source: Path, target_path: Path) -> Path:
+        """Place a script at a target path, hardlinking it when possible
+        
+        Args:
+            source: Path of the script on the host
+            target_path: Path to place the script at
+            
+        Returns:
+            The target path
+        """
+        try:
+            os.link(source, target_path)
+        except OSError:
+            copy_file(source, target_path)
+        return target_path
+    
+    def run_commands(
+        self,
+        commands: List[Tuple[ShellConfig, List[LabeledCommand]]],
+        mounts: Tuple[str, ...] = ()
+    ) -> None:
+        """Run the commands of each configuration and export their results
+        
+        Commands of a configuration run in order and stop at the first
+        failure; separate configurations run concurrently. Resources are
+        created and outputs exported on the calling thread, named by the
+        command labels so names stay the same across runs.
+        
+        Args:
+            commands: Shell configuration and its labeled commands to execute, in order
+            mounts: Host directories made available read-only to container commands
+        """
+        with ExitStack() as stack:
+            # Start one container per configuration and image, shared by its commands
+            sessions: Dict[Tuple[str, str], ContainerSession] = {}
+            for config, _ in commands:
+                image = container_image(config)
+                if image and (config.name, image) not in sessions:
+                    sessions[(config.name, image)] = stack.enter_context(
+                        ContainerRunner.session(image, mounts)
+                    )
+                    
+            config_results = run_coroutine(self.execute_commands(commands, sessions))
+        
+        first_error: Optional[BaseException] = None
+        executed: List[Tuple[ShellConfig, str, Any]] = []
+        for (config, config_commands), results in zip(commands, config_results):
+            if isinstance(results, BaseException):
+                first_error = first_error or results
+                continue
+            executed.extend(
+                (config, label, result)
+                for (label, _), result in zip(config_commands, results)
+            )
+        
+        # Properties shared by all commands of a configuration, built once
+        props_base: Dict[str, Dict[str, Any]] = {}
+        for config, _ in commands:
+            if config.name not in props_base:
+                props_base[config.name] = {
+                    'shell_type': config.type,
+                    'isolation': config.isolation.model_dump() if config.isolation else None,
+                    'config_name': config.name
+                }
+        
+        # Create resources of the commands that ran, with proper naming
+        command_resources = self.create_resources(
+            (
+                f'shell:command:{config.name}',
+                f"command.{config.name}.{hashlib.blake2b(text.encode('utf-8'), digest_size=4).hexdigest()}",
+                {'command': text, **props_base[config.name]}
+            )
+            for config, text, _ in executed
+        )
+        
+        # Export each output once, after all results are stored
+        with self.deferred_exports():
+            for (config, text, result), command_resource in zip(executed, command_resources):
+                if isinstance(result, subprocess.CalledProcessError):
+                    # Store and export error data
+                    error_data = {
+                        'command': text,
+                        'error': result.stderr,
+                        'exit_code': result.returncode
+                    }
+                    self.export_output(f'{config.name}_error', error_data, command_resource)
+                    first_error = first_error or result
+                else:
+                    # Store and export command output
+                    output_data = {
+                        'command': text,
+                        'output': result.stdout.strip(),
+                        'exit_code': result.returncode
+                    }
+                    self.export_output(f'{config.name}_output', output_data, command_resource)
+        
+        if first_error:
+            raise first_error
     
     def validate_config(self, config: Dict[str, Any]) -> None:
         """Validate shell extension configuration
@@ -91,49 +362,66 @@ class ShellExtension(ExtensionHandler):
         # Config should be a dictionary of shell configurations
         if not isinstance(config, dict):
             raise ValueError("Shell extension configuration must be a dictionary")
-            
-        # Validate each configuration
-        self.configs = []
+        
         for name, item in config.items():
             # Add name to config if not present
             if 'name' not in item:
                 item['name'] = name
-            
-            shell_config = ShellConfig(**item)
+        
+        # Validate all configurations in one pass
+        self.configs = SHELL_CONFIGS_ADAPTER.validate_python(list(config.values()))
+        for shell_config in self.configs:
             shell_config.validate_config()
-            self.configs.append(shell_config)
-            
+        self.validated_config = config
+    
     def execute(self, config: Dict[str, Any]) -> None:
         """Execute shell commands or scripts
         
+        Commands and then scripts of each configuration run in order,
+        separate configurations concurrently. The configuration is only
+        validated if it was not validated already.
+        
         Args:
             config: Configuration dictionary
         """
-        self.validate_config(config)
+        if config is not self.validated_config:
+            self.validate_config(config)
         
         if not self.configs:
             raise RuntimeError("No valid configurations found")
         
-        # Execute each configuration
-        for config in self.configs:
-            # Execute direct commands
-            if config.commands:
-                for command in config.commands:
-                    self.execute_command(config, command)
-                    
-            # Execute scripts
-            if config.scripts:
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-                    for script in config.scripts:
-                        # Create target directory structure if needed
-                        target_path = temp_path / script.file
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        # Download script with auth if configured
-                        downloaded_path = ResourceDownloader.download(
-                            script.location,
-                            target=target_path,
-                            auth=script.auth
-                        )
-                        self.execute_command(config, f"{script.type} {downloaded_path}") 
\ No newline at end of file
+        images = {container_image(config) for config in self.configs} - {None}
+        
+        with ThreadPoolExecutor(max_workers=1) as executor, tempfile.TemporaryDirectory() as temp_root:
+            # Warm container images while scripts are downloaded
+            image_pull = executor.submit(ContainerRunner.pull_images, images)
+            
+            commands: List[Tuple[ShellConfig, List[LabeledCommand]]] = []
+            downloads: List[Tuple[ShellConfig, ShellScript, Path]] = []
+            for config in self.configs:
+                # Direct commands
+                commands.append((config, [(command, command) for command in config.commands or []]))
+                
+                # Scripts
+                if config.scripts:
+                    # Scripts of each configuration get their own directory in the run's tempdir
+                    temp_path = Path(temp_root) / config.name
+                    downloads.extend(
+                        (config, script, temp_path / script.file) for script in config.scripts
+                    )
+            
+            # Fetch all scripts at once, then run each after its configuration's commands
+            downloaded_paths = self.download_scripts(downloads)
+            config_commands = {id(config): config_cmds for config, config_cmds in commands}
+            for (config, script, target_path), downloaded_path in zip(downloads, downloaded_paths):
+                if container_image(config) and downloaded_path != target_path:
+                    # Local scripts are used in place, put them in the mounted tempdir for containers
+                    downloaded_path = self.stage_script(downloaded_path, target_path)
+                # Labeled by location, the downloaded path changes every run
+                config_commands[id(config)].append(
+                    (f"{script.type} {script.location}", [script.type, str(downloaded_path)])
+                )
+            
+            image_pull.result()
+            # Downloaded scripts are read from the run's tempdir inside containers too
+            self.run_commands(commands, (temp_root,))
@@ -7,7 +7,9 @@ Responsible for:
 4. Running pipeline
 """
 import json
-from pipeline_orchestrator.core.bootstrap import PipelineBootstrap
+import logging
+import sys
+from pipeline_orchestrator.core.bootstrap import PipelineBootstrap, is_mock_mode
 from pipeline_orchestrator.core.logging import setup_logger
 
 def main():
@@ -17,7 +19,8 @@ def main():
     logger.info("Starting pipeline")
     try:
         # Create and initialize pipeline
-        bootstrap = PipelineBootstrap()
+        mock_mode = is_mock_mode()
+        bootstrap = PipelineBootstrap(mock_mode=mock_mode)
         bootstrap.load_configuration()
         
         # Create and run orchestrator
@@ -25,16 +28,19 @@ def main():
         orchestrator.execute()
         
         # Output extension data when running directly (not through Pulumi)
-        if bootstrap.is_mock_mode():
-            # Get resource tree
-            logger.debug("Resource Tree:")
-            logger.debug(json.dumps(orchestrator.pulumi.get_resource_tree(), indent=2))
+        if mock_mode:
+            # Get resource tree, only walked when it will be logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Resource Tree:")
+                logger.debug(json.dumps(orchestrator.pulumi.get_resource_tree(), indent=2))
             
             # Get extension data
             all_data = orchestrator.state.get_all_extension_data()
             if all_data:
-                print("\nPipeline Output:")
-                print(json.dumps(all_data, indent=2))
+                # Stream the JSON instead of building it as one string
+                sys.stdout.write("\nPipeline Output:\n")
+                json.dump(all_data, sys.stdout, indent=2)
+                sys.stdout.write("\n")
         
         logger.info("Pipeline completed successfully")
     except Exception as e:
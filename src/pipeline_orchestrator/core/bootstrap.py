@@ -5,54 +5,65 @@ Responsible for:
 2. Setting up the core pipeline context
 3. Initializing the extension system
 """
+import functools
+import hashlib
+import json
 import logging
 import os
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
-import yaml
+from typing import Any, Optional
 
 from pipeline_orchestrator.models.pipeline import (
     PipelineConfig,
     PipelineDefinition,
-    PipelineRawConfig
+    TRUSTED_CONFIG,
+    get_extensions,
+    load_cached,
+    load_raw_config,
+    load_yaml
 )
 from pipeline_orchestrator.core.loader import ExtensionLoader
 from pipeline_orchestrator.core.orchestrator import PipelineOrchestrator
 from pipeline_orchestrator.interfaces.pulumi import PulumiInterface
+from pipeline_orchestrator.helpers.cache import get_cache_dir
+
+@functools.cache
+def is_mock_mode() -> bool:
+    """
+    Determines if the code is running directly through Python (mock mode)
+    or through Pulumi's runtime.
+    
+    The answer cannot change within a process, so it is computed once.
+    """
+    # PULUMI_RUNTIME_VERSION is automatically set when running through `pulumi up`,
+    # checked first so direct runs do not need to import pulumi
+    if not os.getenv('PULUMI_RUNTIME_VERSION'):
+        return True
+        
+    try:
+        import pulumi
+        # When running through pulumi runtime, we should be able to get a valid stack
+        return not pulumi.get_stack()
+    except Exception:
+        return True
 
 class PipelineBootstrap:
     """Handles pipeline initialization and configuration loading"""
     
-    def __init__(self):
+    def __init__(self, mock_mode: Optional[bool] = None):
+        """Initialize the bootstrap
+        
+        Args:
+            mock_mode: Whether to run without Pulumi's runtime, detected if not given
+        """
         # Detect if running directly with Python (not through Pulumi)
-        mock_mode = self.is_mock_mode()
-        self.pulumi = PulumiInterface(mock_mode=mock_mode)
+        self.mock_mode = is_mock_mode() if mock_mode is None else mock_mode
+        self.pulumi = PulumiInterface(mock_mode=self.mock_mode)
         self.logger = logging.getLogger("pipeline.bootstrap")
         self.config: Optional[PipelineConfig] = None
         self.pipeline: Optional[PipelineDefinition] = None
         
-    def is_mock_mode(self) -> bool:
-        """
-        Determines if the code is running directly through Python (mock mode)
-        or through Pulumi's runtime.
-        """
-        try:
-            import pulumi
-            # When running through pulumi runtime, we should be able to get a valid stack
-            stack = pulumi.get_stack()
-            if not stack:
-                return True
-            
-            # Check if PULUMI_RUNTIME_VERSION env var is set
-            # This is automatically set when running through `pulumi up`
-            if not os.getenv('PULUMI_RUNTIME_VERSION'):
-                return True
-                
-            return False
-        except (ImportError, Exception):
-            return True
-            
-        
     def load_configuration(self) -> None:
         """Load and validate pipeline configuration"""
         # Get configuration through Pulumi interface
@@ -64,34 +75,43 @@ class PipelineBootstrap:
             
         self.logger.info(f"Loading pipeline configuration from: {pipeline_file}")
         
-        # Load raw YAML into initial model
-        with open(pipeline_file) as f:
-            raw_config = PipelineRawConfig(root=yaml.safe_load(f))
+        # Reuse the parsed form of an unchanged file from a previous run,
+        # parsing the YAML directly when the cache is not usable
+        file_bytes = pipeline_file.read_bytes()
+        cache_file: Optional[Path] = None
+        raw_data = None
+        try:
+            cache_file = get_cache_dir() / f"cfg-{hashlib.blake2b(file_bytes, digest_size=16).hexdigest()}.json"
+        except OSError as e:
+            self.logger.debug(f"Pipeline configuration cache not available: {e}")
+        else:
+            raw_data = self._read_cached_configuration(cache_file)
+        if raw_data is None:
+            raw_data = load_yaml(file_bytes)
+            
+        # Validate raw YAML data
+        raw_config = load_raw_config(raw_data)
         
         # Get pipeline name and raw data
-        pipeline_name = next(iter(raw_config.root.keys()))
-        pipeline_data = raw_config.root[pipeline_name]
+        pipeline_name = next(iter(raw_config.keys()))
+        pipeline_data = raw_config[pipeline_name]
         
         # Extract core config and extensions
         core_config = pipeline_data.get('core', {})
-        raw_extensions = raw_config.get_extensions()
+        raw_extensions = get_extensions(raw_config)
         
-        # Transform list extensions into dictionaries keyed by name
-        extensions = {}
+        # Extensions must be lists of items
         for ext_type, items in raw_extensions.items():
             if not isinstance(items, list):
                 raise ValueError(f"Extension {ext_type} must be a list of items")
-            
-            # Convert list of items into dictionary by name field
-            extensions[ext_type] = {
-                item['name']: item
-                for item in items
-                if 'name' in item
-            }
-            
-            # Add mocked mode to extension
-            # extensions[ext_type]["mocked_mode"] = self.pulumi.mock_mode
-            
+                
+        # Transform list extensions into dictionaries keyed by name field
+        get_name = itemgetter('name')
+        extensions = {
+            ext_type: {get_name(item): item for item in items if 'name' in item}
+            for ext_type, items in raw_extensions.items()
+        }
+        
         # Transform into proper pipeline structure
         transformed = {
             pipeline_name: {
@@ -100,11 +120,41 @@ class PipelineBootstrap:
             }
         }
         
-        # Create and validate final config
-        self.config = PipelineConfig(root=transformed)
+        # Create and validate final config, trusted configurations skip validation
+        # and configurations loaded before in this process are reused
+        if TRUSTED_CONFIG:
+            self.config = PipelineConfig.from_trusted(transformed)
+        else:
+            self.config = load_cached(transformed)
         self.pipeline = self.config.get_pipeline()
         self.logger.info(f"Pipeline configuration loaded and validated with {len(extensions)} extensions")
         
+        if cache_file and not cache_file.exists():
+            self._write_cached_configuration(cache_file, raw_data)
+            
+    def _read_cached_configuration(self, cache_file: Path) -> Optional[Any]:
+        """Read a previously parsed pipeline configuration, if cached"""
+        try:
+            return json.loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+            
+    def _write_cached_configuration(self, cache_file: Path, raw_data: Any) -> None:
+        """Cache a parsed pipeline configuration as JSON
+        
+        Configurations that do not survive a JSON round trip unchanged
+        (e.g. dates or non-string keys) are not cached.
+        """
+        try:
+            serialized = json.dumps(raw_data)
+            if json.loads(serialized) != raw_data:
+                return
+            partial = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.part")
+            partial.write_text(serialized)
+            os.replace(partial, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not cache pipeline configuration: {e}")
+        
     def create_orchestrator(self) -> PipelineOrchestrator:
         """Create and initialize the pipeline orchestrator"""
         if not self.pipeline:
@@ -8,33 +8,32 @@ Responsible for:
 """
 
 import logging
-from typing import TypeVar, Type
+from contextlib import contextmanager
+from typing import Iterator, TypeVar, Type
 from pipeline_orchestrator.handlers.extension import ExtensionHandler
 
 T = TypeVar('T', bound=ExtensionHandler)
 
-class ExtensionContext:
-    """Context manager for extension execution"""
+@contextmanager
+def extension_context(extension: T) -> Iterator[T]:
+    """Context manager for extension execution
     
-    def __init__(self, extension: ExtensionHandler):
-        self.extension = extension
-        self.logger = logging.getLogger("pipeline.context")
-        
-    def __enter__(self):
-        """Setup extension context"""
-        return self.extension
-        
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Ensure cleanup on exit"""
+    Ensures the extension is cleaned up on exit. Cleanup errors are logged,
+    and exceptions raised in the context are not suppressed.
+    """
+    try:
+        yield extension
+    finally:
         try:
-            self.extension.cleanup()
+            extension.cleanup()
         except Exception as e:
-            self.logger.error(f"Error during extension cleanup: {str(e)}", exc_info=True)
-        return False  # Don't suppress exceptions
+            logging.getLogger("pipeline.context").error(
+                f"Error during extension cleanup: {str(e)}", exc_info=True
+            )
         
 def with_extension(extension_cls: Type[T]) -> T:
     """Decorator for extension execution with context management"""
     def wrapper(*args, **kwargs):
-        with ExtensionContext(extension_cls()) as ext:
+        with extension_context(extension_cls()) as ext:
             return ext.execute(*args, **kwargs)
-    return wrapper 
\ No newline at end of file
+    return wrapper
\ No newline at end of file
@@ -8,10 +8,13 @@ Responsible for:
 """
 
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
-from typing import Dict, Type, Any
-from pathlib import Path
+from importlib.metadata import distributions
+from typing import Dict, Type, Any, Optional, Tuple
+from types import ModuleType
 
 from pipeline_orchestrator.models.pipeline import PipelineConfig
 from pipeline_orchestrator.handlers.extension import ExtensionHandler
@@ -21,18 +24,42 @@ from pipeline_orchestrator.core.errors import (
     ExtensionValidationError
 )
 
+# Methods every extension class must provide
+_REQUIRED_METHODS = ('validate_config', 'execute', 'cleanup')
+
+# Methods ExtensionHandler only declares, every extension class must override them
+_ABSTRACT_METHODS = frozenset({'validate_config', 'execute'})
+
+def _cached_import(module_path: str) -> ModuleType:
+    """Import a module, returning it straight from sys.modules when already imported"""
+    module = sys.modules.get(module_path)
+    spec = getattr(module, "__spec__", None)
+    if module is None or spec is None or getattr(spec, "_initializing", False):
+        # Not imported yet, or still being imported by another thread
+        module = import_module(module_path)
+    return module
+
 class ExtensionLoader:
     """Dynamic extension loader"""
     
     EXTENSION_PACKAGE_PREFIX = "pipeline_orchestrator_extension_"
+    _PREFIX_LEN = len(EXTENSION_PACKAGE_PREFIX)
     EXTENSION_CLASS_SUFFIX = "Extension"
+    EXTENSION_ENTRY_POINT_GROUP = "pipeline_orchestrator.extensions"
+    EXTENSION_DISTRIBUTION_PREFIXES = ("pulumi_orchestrator_extension_", "pipeline_orchestrator_extension_")
+    _DISTRIBUTION_PREFIXES = tuple((prefix, len(prefix)) for prefix in EXTENSION_DISTRIBUTION_PREFIXES)
+    MAX_LOAD_WORKERS = 8
     
     def __init__(self, config: PipelineConfig):
         self.config = config
+        self._pipeline = config.get_pipeline()
+        self._required = frozenset(self._pipeline.extensions.keys())  # Extensions required by the pipeline
         self.logger = logging.getLogger("pipeline.loader")
         self.installed_extensions: Dict[str, str] = {}  # Maps extension name to module path
         self.loaded_extensions: Dict[str, Type[ExtensionHandler]] = {}
         self.extension_dir = None
+        self._class_name_cache: Dict[str, str] = {}  # Maps extension name to handler class name
+        self._discovery_cache_key: Optional[Tuple[Tuple[str, ...], str]] = None
         
     def get_extension_status(self) -> Dict[str, Any]:
         """Get current status of extension discovery and loading
@@ -44,8 +71,7 @@ class ExtensionLoader:
             missing: Required extensions that are not installed
             extra: Installed extensions not required by configuration
         """
-        pipeline = self.config.get_pipeline()
-        required = set(pipeline.extensions.keys())
+        required = self._required
         installed = set(self.installed_extensions.keys())
         loaded = set(self.loaded_extensions.keys())
         
@@ -60,34 +86,33 @@ class ExtensionLoader:
     def discover_pip_installed_extensions(self) -> Dict[str, str]:
         """Find pip-installed extensions in the Python environment
         
-        Looks for installed packages that follow the naming convention:
-        pulumi-orchestrator-extension-{name}
+        Reads the installed distribution metadata instead of scanning sys.path.
+        An installed distribution provides an extension if it either:
+        1. Registers an entry point in the pipeline_orchestrator.extensions group,
+           named after the extension and pointing at its module
+        2. Follows the naming convention pulumi-orchestrator-extension-{name}
         
         Returns:
             Dict mapping extension names to their module paths
         """
         self.logger.info("Starting pip-installed extension discovery")
         
-        for path in sys.path:
-            if not path:
-                continue
-                
-            path_obj = Path(path)
-            if not path_obj.exists():
-                continue
-                
-            # Look for packages matching our naming convention
-            for item in path_obj.glob(f"{self.EXTENSION_PACKAGE_PREFIX}*"):
-                if not item.is_dir():
-                    continue
-                    
-                # Extract extension name from package name
-                extension_name = item.name.replace(self.EXTENSION_PACKAGE_PREFIX, "")
+        for dist in distributions():
+            # Extensions registered through entry points
+            for entry_point in dist.entry_points.select(group=self.EXTENSION_ENTRY_POINT_GROUP):
+                self.installed_extensions[sys.intern(entry_point.name)] = entry_point.module
+                self.logger.info("Found pip-installed extension: %s -> %s", entry_point.name, entry_point.module)
                 
-                # Use the package name directly as the module path
-                module_path = item.name
-                self.installed_extensions[extension_name] = module_path
-                self.logger.info(f"Found pip-installed extension: {extension_name} -> {module_path}")
+            # Extensions following the distribution naming convention
+            dist_name = (dist.metadata["Name"] or "").lower().replace("-", "_").replace(".", "_")
+            for prefix, prefix_len in self._DISTRIBUTION_PREFIXES:
+                if dist_name.startswith(prefix):
+                    extension_name = sys.intern(dist_name[prefix_len:])
+                    if extension_name not in self.installed_extensions:
+                        module_path = f"{self.EXTENSION_PACKAGE_PREFIX}{extension_name}"
+                        self.installed_extensions[extension_name] = module_path
+                        self.logger.info("Found pip-installed extension: %s -> %s", extension_name, module_path)
+                    break
         
         return self.installed_extensions
 
@@ -107,63 +132,93 @@ class ExtensionLoader:
             self.logger.info("No extension directory specified or directory does not exist")
             return {}
             
-        for item in self.extension_dir.iterdir():
-            if item.is_dir() and item.name.startswith(self.EXTENSION_PACKAGE_PREFIX):
-                extension_name = item.name.replace(self.EXTENSION_PACKAGE_PREFIX, "")
-                
-                # Add extension directory to Python path if not already there
-                if str(self.extension_dir) not in sys.path:
-                    sys.path.insert(0, str(self.extension_dir))
-                    self.logger.debug(f"Added {self.extension_dir} to sys.path")
+        prefix = self.EXTENSION_PACKAGE_PREFIX
+        found = False
+        with os.scandir(self.extension_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith(prefix) and entry.is_dir()):
+                    continue
+                extension_name = sys.intern(entry.name[self._PREFIX_LEN:])
                 
                 # Use the package name as the module path
-                module_path = item.name
+                module_path = entry.name
+                pip_module_path = self.installed_extensions.get(extension_name)
+                if pip_module_path is not None:
+                    self.logger.info(
+                        "Directory extension %s takes precedence over pip-installed %s",
+                        extension_name, pip_module_path
+                    )
                 self.installed_extensions[extension_name] = module_path
-                self.logger.info(f"Found directory extension: {extension_name} -> {module_path}")
+                self.logger.info("Found directory extension: %s -> %s", extension_name, module_path)
+                found = True
+                
+        # Add extension directory to Python path if it has extensions and is not already there
+        extension_dir = str(self.extension_dir)
+        if found and extension_dir not in sys.path:
+            sys.path.insert(0, extension_dir)
+            self.logger.debug("Added %s to sys.path", extension_dir)
         
         return self.installed_extensions
         
     def discover_installed_extensions(self) -> Dict[str, str]:
         """Find all installed extensions from both pip packages and directory
         
+        Results are cached for the current sys.path and extension directory,
+        use refresh() to force a new discovery. Extensions in the extension
+        directory take precedence over pip-installed ones.
+        
         Returns:
             Dict mapping extension names to their module paths
         """
         self.logger.info("Starting extension discovery")
         
         # Get required extensions from config
-        pipeline = self.config.get_pipeline()
-        extension_dir = pipeline.core.extension_dir
-        if extension_dir:
-            self.extension_dir = Path(extension_dir)
-        required_extensions = set(pipeline.extensions.keys())
-        self.logger.info(f"Extensions required by pipeline: {required_extensions}")
+        if self._pipeline.core.extension_dir:
+            self.extension_dir = self._pipeline.core.extension_dir_path
+        required_extensions = self._required
+        self.logger.info("Extensions required by pipeline: %s", required_extensions)
         
+        if self._discovery_cache_key == (tuple(sys.path), str(self.extension_dir)):
+            self.logger.info("Using cached extension discovery")
+            return self.installed_extensions
+            
         # Clear existing discoveries
         self.installed_extensions.clear()
         
         # Discover extensions from both sources
         self.discover_pip_installed_extensions()
         self.discover_directory_extensions()
+            
+        # Keyed after discovery, which may add the extension directory to sys.path
+        self._discovery_cache_key = (tuple(sys.path), str(self.extension_dir))
         
         installed = set(self.installed_extensions.keys())
-        self.logger.info(f"Total installed extensions found: {installed}")
+        self.logger.info("Total installed extensions found: %s", installed)
         
         # Report on extension status
         missing_extensions = required_extensions - installed
         if missing_extensions:
-            self.logger.warning(f"Required extensions not installed: {missing_extensions}")
+            self.logger.warning("Required extensions not installed: %s", missing_extensions)
         
         extra_extensions = installed - required_extensions
         if extra_extensions:
-            self.logger.info(f"Extra extensions installed but not required: {extra_extensions}")
+            self.logger.info("Extra extensions installed but not required: %s", extra_extensions)
             
-        status = self.get_extension_status()
-        self.logger.info(f"Discovery complete. Found {len(self.installed_extensions)} installed extensions")
-        self.logger.debug(f"Extension discovery status: {status}")
+        self.logger.info("Discovery complete. Found %s installed extensions", len(self.installed_extensions))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Extension discovery status: %s", self.get_extension_status())
         
         return self.installed_extensions
             
+    def refresh(self) -> Dict[str, str]:
+        """Discover installed extensions again, ignoring cached results
+        
+        Returns:
+            Dict mapping extension names to their module paths
+        """
+        self._discovery_cache_key = None
+        return self.discover_installed_extensions()
+            
     def validate_extension(self, name: str, extension_class: Type[Any]) -> bool:
         """Validate an extension class meets requirements"""
         # Must inherit from ExtensionHandler
@@ -174,11 +229,11 @@ class ExtensionLoader:
                 {"error": "Class must inherit from ExtensionHandler"}
             )
             
-        # Must implement required methods
-        required_methods = ['validate_config', 'execute', 'cleanup']
+        # Must implement required methods, not just inherit the base declarations
         missing_methods = [
-            method for method in required_methods
-            if not callable(getattr(extension_class, method, None))
+            method for method in _REQUIRED_METHODS
+            if not callable(implementation := getattr(extension_class, method, None))
+            or (method in _ABSTRACT_METHODS and implementation is getattr(ExtensionHandler, method))
         ]
         
         if missing_methods:
@@ -204,24 +259,29 @@ class ExtensionLoader:
             ExtensionLoadError: If extension cannot be loaded
             ExtensionValidationError: If extension fails validation
         """
+        if name in self.loaded_extensions:
+            return self.loaded_extensions[name]
+            
         try:
             if name not in self.installed_extensions:
                 raise ExtensionNotFoundError(name)
                 
             module_path = self.installed_extensions[name]
-            class_name = f"{name.title()}{self.EXTENSION_CLASS_SUFFIX}"
+            class_name = self._class_name_cache.get(name)
+            if class_name is None:
+                class_name = self._class_name_cache[name] = f"{name.title()}{self.EXTENSION_CLASS_SUFFIX}"
             
-            self.logger.info(f"Loading extension module: {module_path}")
+            self.logger.info("Loading extension module: %s", module_path)
             
             # Import the module
             try:
-                self.logger.debug(f"Importing module: {module_path}")
-                module = import_module(module_path)
+                self.logger.debug("Importing module: %s", module_path)
+                module = _cached_import(module_path)
                 
                 # Get the extension class
                 if not hasattr(module, class_name):
                     available = [name for name in dir(module) if name.endswith(self.EXTENSION_CLASS_SUFFIX)]
-                    self.logger.debug(f"Available extension classes: {available}")
+                    self.logger.debug("Available extension classes: %s", available)
                     raise ExtensionLoadError(
                         f"Could not find {class_name} in {module_path}",
                         name,
@@ -231,17 +291,17 @@ class ExtensionLoader:
                 extension_class = getattr(module, class_name)
                 
                 # Validate the extension
-                self.logger.info(f"Validating extension: {name}")
+                self.logger.info("Validating extension: %s", name)
                 self.validate_extension(name, extension_class)
                 
                 # Store the loaded extension
                 self.loaded_extensions[name] = extension_class
-                self.logger.info(f"Successfully loaded extension: {name}")
+                self.logger.info("Successfully loaded extension: %s", name)
                 
                 return extension_class
                 
             except ImportError as e:
-                self.logger.error(f"Import error: {str(e)}")
+                self.logger.error("Import error: %s", e)
                 raise ExtensionLoadError(
                     f"Failed to import {module_path}",
                     name,
@@ -249,9 +309,16 @@ class ExtensionLoader:
                 )
                 
         except Exception as e:
-            self.logger.error(f"Failed to load extension {name}: {str(e)}")
+            self.logger.error("Failed to load extension %s: %s", name, e)
             raise
 
+    def _load_extension_logged(self, name: str) -> None:
+        """Load an extension, logging instead of raising extension errors"""
+        try:
+            self.load_extension(name)
+        except (ExtensionNotFoundError, ExtensionLoadError, ExtensionValidationError) as e:
+            self.logger.error("Failed to load extension %s: %s", name, e)
+            
     def load_extensions(self) -> Dict[str, Type[ExtensionHandler]]:
         """Load all required extensions that are installed
         
@@ -265,18 +332,16 @@ class ExtensionLoader:
         self.logger.info("Loading required extensions")
         
         # Get required extensions that are installed
-        pipeline = self.config.get_pipeline()
-        required_extensions = set(pipeline.extensions.keys())
-        available_extensions = required_extensions & set(self.installed_extensions.keys())
+        available_extensions = self._required & self.installed_extensions.keys()
         
-        # Load each extension
-        for name in available_extensions:
-            try:
-                self.load_extension(name)
-            except (ExtensionNotFoundError, ExtensionLoadError, ExtensionValidationError) as e:
-                self.logger.error(f"Failed to load extension {name}: {str(e)}")
+        # Load extensions in parallel, imports spend most of their time on disk I/O
+        if available_extensions:
+            with ThreadPoolExecutor(
+                max_workers=min(self.MAX_LOAD_WORKERS, len(available_extensions))
+            ) as executor:
+                list(executor.map(self._load_extension_logged, available_extensions))
                 
-        status = self.get_extension_status()
-        self.logger.info(f"Extension loading complete. Status: {status}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Extension loading complete. Status: %s", self.get_extension_status())
         
         return self.loaded_extensions 
\ No newline at end of file
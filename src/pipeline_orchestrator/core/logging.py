@@ -7,10 +7,36 @@ Responsible for:
 """
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from datetime import datetime
 
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Records buffered before they are written to the log file
+LOG_BUFFER_CAPACITY = 64
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats each second's timestamp only once
+    
+    The date format has second resolution, so records logged within the
+    same second share the formatted time.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, "")  # Second and its formatted time
+        
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = super().formatTime(record, datefmt)
+            self._cached_time = (second, formatted)
+        return formatted
+
 def setup_logger(log_level: str = "INFO", log_dir: Path = Path("logs")) -> logging.Logger:
     """Configure and return the pipeline logger"""
     
@@ -21,14 +47,16 @@ def setup_logger(log_level: str = "INFO", log_dir: Path = Path("logs")) -> loggi
     logger = logging.getLogger("pipeline")
     logger.setLevel(getattr(logging, log_level.upper()))
     
-    # Clear any existing handlers
+    # Flush and close any existing handlers, including buffered file output
+    for handler in logger.handlers:
+        target = getattr(handler, 'target', None)  # Cleared by MemoryHandler.close
+        handler.close()
+        if target:
+            target.close()
     logger.handlers.clear()
     
     # Create formatters
-    formatter = logging.Formatter(
-        '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = CachedTimeFormatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -37,9 +65,16 @@ def setup_logger(log_level: str = "INFO", log_dir: Path = Path("logs")) -> loggi
     
     # File handler
     file_handler = logging.FileHandler(
-        log_dir / f"pipeline_{datetime.now():%Y%m%d_%H%M%S}.log"
+        log_dir / f"pipeline_{datetime.now():%Y%m%d_%H%M%S}.log",
+        delay=True  # Only create the file once a record is written
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    
+    # Batch file writes, flushing when full, on warnings and at shutdown
+    logger.addHandler(logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=file_handler
+    ))
     
     return logger 
\ No newline at end of file
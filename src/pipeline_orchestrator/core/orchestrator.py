@@ -8,11 +8,12 @@ Responsible for:
 """
 
 import logging
+import sys
 from typing import Dict, Any, Type
 from pipeline_orchestrator.models.pipeline import PipelineDefinition
 from pipeline_orchestrator.interfaces.pulumi import PulumiInterface
 from pipeline_orchestrator.handlers.extension import ExtensionHandler
-from pipeline_orchestrator.core.context import ExtensionContext
+from pipeline_orchestrator.core.context import extension_context
 from pipeline_orchestrator.core.state import PipelineState
 from pipeline_orchestrator.core.errors import (
     ErrorHandler,
@@ -35,12 +36,14 @@ class PipelineOrchestrator:
     def register_extensions(self, loaded_extensions: Dict[str, Type[ExtensionHandler]]) -> None:
         """Register pre-loaded extensions with the orchestrator"""
         for name, extension_cls in loaded_extensions.items():
+            # Interned, as extension names key the orchestrator and state dicts
+            name = sys.intern(name)
             try:
                 extension = extension_cls()
                 extension.initialize(name, self.parent_stack_name, self.pulumi)
                 self.extensions[name] = extension
                 self.state.set_extension_state(name, 'registered')
-                self.logger.info(f"Extension {name} registered successfully")
+                self.logger.info("Extension %s registered successfully", name)
             except Exception as e:
                 self.error_handler.handle_error(e, f"extension.{name}")
         
@@ -48,7 +51,7 @@ class PipelineOrchestrator:
         """Get configuration for a specific extension with resolved references"""
         raw_config = self.pipeline.extensions.get(extension_name, {})  # Default to empty dict if not found
         if not raw_config:
-            self.logger.warning(f"No configuration found for extension: {extension_name}")
+            self.logger.warning("No configuration found for extension: %s", extension_name)
         return self.state.resolve_references(raw_config)
         
     def execute(self) -> None:
@@ -67,18 +70,18 @@ class PipelineOrchestrator:
         # Execute each extension with context management
         for name, extension in self.extensions.items():
             if name not in self.pipeline.extensions:
-                self.logger.warning(f"Skipping unconfigured extension: {name}")
+                self.logger.warning("Skipping unconfigured extension: %s", name)
                 continue
                 
-            self.logger.info(f"Processing extension: {name}")
+            self.logger.info("Processing extension: %s", name)
             self.state.set_extension_state(name, 'starting')
             config = self.get_extension_config(name)
             if not config:
                 continue
                 
             try:
-                with ExtensionContext(extension):
-                    self.logger.info(f"Validating configuration for {name}")
+                with extension_context(extension):
+                    self.logger.info("Validating configuration for %s", name)
                     try:
                         extension.validate_config(config)
                     except Exception as e:
@@ -88,16 +91,16 @@ class PipelineOrchestrator:
                             {"error": str(e)}
                         )
                         
-                    self.logger.info(f"Executing extension: {name}")
+                    self.logger.info("Executing extension: %s", name)
                     extension.execute(config)
                     
                     # Store any data produced by the extension
                     if hasattr(extension, 'get_output_data'):
-                        self.logger.info(f"Storing output data for {name}")
+                        self.logger.info("Storing output data for %s", name)
                         self.state.store_extension_data(name, extension.get_output_data())
                         
                     self.state.set_extension_state(name, 'success')
-                    self.logger.info(f"Extension {name} completed successfully")
+                    self.logger.info("Extension %s completed successfully", name)
             except Exception as e:
                 self.state.set_extension_state(name, 'failed')
                 self.error_handler.handle_error(e, f"extension.{name}")
@@ -114,12 +117,13 @@ class PipelineOrchestrator:
         cleanup_errors = []
         
         # Clean up extensions in reverse order
-        for name, extension in reversed(list(self.extensions.items())):
-            self.logger.info(f"Cleaning up extension: {name}")
+        for name in reversed(self.extensions):
+            extension = self.extensions[name]
+            self.logger.info("Cleaning up extension: %s", name)
             try:
                 extension.cleanup()
                 self.state.set_extension_state(name, 'cleaned')
-                self.logger.info(f"Extension {name} cleaned up successfully")
+                self.logger.info("Extension %s cleaned up successfully", name)
             except Exception as e:
                 cleanup_errors.append((name, e))
                 self.state.set_extension_state(name, 'cleanup_failed')
@@ -8,7 +8,7 @@ Responsible for:
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import re
 
 class PipelineState:
@@ -17,29 +17,36 @@ class PipelineState:
     # Regex patterns for reference resolution
     GROUP_REF_PATTERN = re.compile(r'_group:(\w+):(\w+):(\w+)(?::(\w+))?')
     SECRET_REF_PATTERN = re.compile(r'_secret:(\w+):(\w+)')
+    REF_PREFIXES = ('_secret:', '_group:')
+    REF_PATTERN = re.compile(
+        r'_(?:secret:(?P<vault>\w+):(?P<key>\w+)'
+        r'|group:(?P<ext>\w+):(?P<run>\w+):(?P<group>\w+)(?::(?P<node>\w+))?)'
+    )
     
     def __init__(self):
         self.logger = logging.getLogger("pipeline.state")
         self.execution_state: Dict[str, str] = {}  # Extension execution states
         self.extension_data: Dict[str, Dict[str, Any]] = {}  # Data produced by extensions
         self.secrets: Dict[str, Dict[str, Any]] = {}  # Loaded secrets
+        self._resolve_cache: Dict[str, Any] = {}  # Resolved group values by reference
         
     def set_extension_state(self, extension_name: str, state: str) -> None:
         """Set execution state for an extension"""
         self.execution_state[extension_name] = state
-        self.logger.debug(f"Extension {extension_name} state changed to: {state}")
+        self.logger.debug("Extension %s state changed to: %s", extension_name, state)
         
     def get_extension_state(self, extension_name: str) -> Optional[str]:
         """Get execution state for an extension"""
         state = self.execution_state.get(extension_name)
         if state is None:
-            self.logger.warning(f"No state found for extension: {extension_name}")
+            self.logger.warning("No state found for extension: %s", extension_name)
         return state
         
     def store_extension_data(self, extension_name: str, data: Dict[str, Any]) -> None:
         """Store data produced by an extension"""
         self.extension_data[extension_name] = data
-        self.logger.debug(f"Stored data for extension: {extension_name}")
+        self._resolve_cache.clear()
+        self.logger.debug("Stored data for extension: %s", extension_name)
 
     def get_extension_data(self, extension_name: str) -> Optional[Dict[str, Any]]:
         """Get data produced by an extension
@@ -52,7 +59,7 @@ class PipelineState:
         """
         data = self.extension_data.get(extension_name)
         if data is None:
-            self.logger.warning(f"No data found for extension: {extension_name}")
+            self.logger.warning("No data found for extension: %s", extension_name)
         return data
 
     def get_all_extension_data(self) -> Dict[str, Dict[str, Any]]:
@@ -68,19 +75,30 @@ class PipelineState:
         match = self.GROUP_REF_PATTERN.match(reference)
         if not match:
             return reference
-            
-        ext_name, run_name, group_name, node_name = match.groups()
+        if match.end() == len(reference):
+            return self._resolve_scalar(reference)
+        return self._lookup_group(reference, *match.groups())
+        
+    def _lookup_group(
+        self,
+        reference: str,
+        ext_name: str,
+        run_name: str,
+        group_name: str,
+        node_name: Optional[str]
+    ) -> Any:
+        """Look up the data a parsed group reference points to"""
         ext_data = self.extension_data.get(ext_name, {})
         group_data = ext_data.get(f"{run_name}.{group_name}")
         
         if not group_data:
-            self.logger.warning(f"Could not resolve group reference: {reference}")
+            self.logger.warning("Could not resolve group reference: %s", reference)
             return None
             
         if node_name:
             node_data = group_data.get(node_name)
             if node_data is None:
-                self.logger.warning(f"Node {node_name} not found in group: {reference}")
+                self.logger.warning("Node %s not found in group: %s", node_name, reference)
             return node_data
         return group_data
         
@@ -89,40 +107,87 @@ class PipelineState:
         match = self.SECRET_REF_PATTERN.match(reference)
         if not match:
             return reference
-            
-        vault_name, secret_key = match.groups()
+        if match.end() == len(reference):
+            return self._resolve_scalar(reference)
+        return self._lookup_secret(reference, *match.groups())
+        
+    def _lookup_secret(self, reference: str, vault_name: str, secret_key: str) -> Any:
+        """Look up the secret a parsed secret reference points to"""
         vault = self.secrets.get(vault_name, {})
         secret = vault.get(secret_key)
         
         if secret is None:
-            self.logger.warning(f"Could not resolve secret reference: {reference}")
+            self.logger.warning("Could not resolve secret reference: %s", reference)
             
         return secret
         
+    def _resolve_scalar(self, value: Any) -> Any:
+        """Resolve a value that may be a secret or group reference
+        
+        Resolved group references are cached until extension data is stored.
+        Secrets are looked up every time, since they can be changed in place.
+        """
+        # All references start with '_', so other values cost a single compare
+        if isinstance(value, str) and value[:1] == '_':
+            if value in self._resolve_cache:
+                return self._resolve_cache[value]
+            match = self.REF_PATTERN.fullmatch(value)
+            if match:
+                if match['vault']:
+                    return self._lookup_secret(value, match['vault'], match['key'])
+                resolved = self._lookup_group(value, match['ext'], match['run'], match['group'], match['node'])
+                self._resolve_cache[value] = resolved
+                return resolved
+        return value
+        
+    @classmethod
+    def _has_refs(cls, value: Any) -> bool:
+        """Check whether a value contains any reference strings"""
+        if isinstance(value, str):
+            return value.startswith(cls.REF_PREFIXES)
+        if isinstance(value, dict):
+            return any(cls._has_refs(item) for item in value.values())
+        if isinstance(value, list):
+            return any(cls._has_refs(item) for item in value)
+        return False
+        
     def resolve_references(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively resolve all references in a configuration"""
-        resolved = {}
-        for key, value in config.items():
-            if isinstance(value, dict):
-                resolved[key] = self.resolve_references(value)
-            elif isinstance(value, list):
-                resolved[key] = [
-                    self.resolve_references(item) if isinstance(item, dict)
-                    else self.resolve_secret_reference(item) if isinstance(item, str) and item.startswith('_secret:')
-                    else self.resolve_group_reference(item) if isinstance(item, str) and item.startswith('_group:')
-                    else item
-                    for item in value
-                ]
-            elif isinstance(value, str):
-                if value.startswith('_secret:'):
-                    resolved[key] = self.resolve_secret_reference(value)
-                elif value.startswith('_group:'):
-                    resolved[key] = self.resolve_group_reference(value)
-                else:
-                    resolved[key] = value
-            else:
-                resolved[key] = value
-                
+        """Recursively resolve all references in a configuration
+        
+        Configurations without any references are returned as is.
+        """
+        if not self._has_refs(config):
+            return config
+        return self._resolve_dict(config)
+        
+    def _resolve_value(self, value: Any) -> Any:
+        """Resolve all references in a value of any type"""
+        if isinstance(value, dict):
+            return self._resolve_dict(value)
+        if isinstance(value, list):
+            return self._resolve_list(value)
+        return self._resolve_scalar(value)
+        
+    def _resolve_dict(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Recursively resolve all references in a dictionary
+        
+        Unchanged dictionaries and lists are shared with the input rather
+        than copied; the input is returned when nothing was resolved.
+        """
+        resolved = {key: self._resolve_value(value) for key, value in config.items()}
+        if all(resolved[key] is value for key, value in config.items()):
+            return config
+        return resolved
+        
+    def _resolve_list(self, items: List[Any]) -> List[Any]:
+        """Resolve all references in a list, returning the input when nothing was resolved"""
+        resolved = [
+            self._resolve_dict(item) if isinstance(item, dict)
+            else self._resolve_scalar(item)
+            for item in items
+        ]
+        if all(new_item is item for new_item, item in zip(resolved, items)):
+            return items
         return resolved
         
     def load_secrets(self, secrets_config: Dict[str, Any]) -> None:
@@ -8,12 +8,38 @@ Responsible for:
 5. Extension-specific cleanup
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 import logging
+import sys
 from pipeline_orchestrator.interfaces.pulumi import PulumiInterface, ResourceOptions
 
-class ExtensionHandler(ABC):
+# Number of values kept per output name by default
+DEFAULT_MAX_HISTORY = 128
+
+# Resource types with this prefix are protected
+PROTECTED_TYPE_PREFIX = 'pipeline:extension:'
+
+_ROOT_LOGGER = logging.getLogger("pipeline")
+_EXT_LOGGERS: Dict[str, logging.Logger] = {}  # Extension loggers by extension name
+
+def _get_extension_logger(name: str) -> logging.Logger:
+    """Get the logger of an extension, configured once per process
+    
+    Extension loggers emit through the pipeline logger's handlers directly,
+    without propagating, so each record is dispatched to handlers only once.
+    """
+    logger = _EXT_LOGGERS.get(name)
+    if logger is None:
+        logger = _EXT_LOGGERS[name] = logging.getLogger(f"extensions.{name}")
+        logger.setLevel(_ROOT_LOGGER.level)
+    if _ROOT_LOGGER.handlers and logger.handlers != _ROOT_LOGGER.handlers:
+        logger.handlers = list(_ROOT_LOGGER.handlers)
+        logger.propagate = False
+    return logger
+
+class ExtensionHandler:
     """Base class for all extension handlers
     
     Provides minimal interface requirements for extensions.
@@ -24,15 +50,25 @@ class ExtensionHandler(ABC):
     4. Cleaning up its resources
     """
     
-    def __init__(self):
+    def __init__(self, max_history: int = DEFAULT_MAX_HISTORY):
+        """
+        Args:
+            max_history: Number of most recent values kept per output name
+        """
         self.state: Dict[str, Any] = {}
-        self.outputs: Dict[str, Any] = {}
+        self.outputs: Dict[str, deque] = {}
+        self._max_history = max_history
         self.pulumi: Optional[PulumiInterface] = None
         self.name: Optional[str] = None
         self.parent_stack_name: Optional[str] = None
         self.stack_name: Optional[str] = None
         self.stack_resource: Optional[Any] = None
         self.logger: Optional[logging.Logger] = None
+        self.validated_config: Optional[Dict[str, Any]] = None  # Last configuration passed validation
+        self._default_opts: Optional[ResourceOptions] = None  # Set by initialize
+        self._protect_prefix: Optional[str] = None  # Resource type of the extension stack resource
+        self._defer_exports = False
+        self._pending_exports: Dict[str, Optional[Any]] = {}  # Output name to export parent
         
     def initialize(self, name: str, parent_stack_name: str, pulumi: PulumiInterface) -> None:
         """Initialize the extension with required context
@@ -45,13 +81,13 @@ class ExtensionHandler(ABC):
         self.name = name
         self.parent_stack_name = parent_stack_name
         self.pulumi = pulumi
-        self.logger = logging.getLogger(f"extensions.{name}")
+        self.logger = _get_extension_logger(name)
         
         # Create extension-specific stack name
         self.stack_name = f"{self.parent_stack_name}.{self.name}"
         
         # Create stack resource with proper naming
-        extension_type = f'pipeline:extension:{self.name}'
+        extension_type = self._protect_prefix = sys.intern(f'{PROTECTED_TYPE_PREFIX}{self.name}')
         self.stack_resource = pulumi.create_component_resource(
             extension_type,
             self.stack_name,
@@ -65,6 +101,9 @@ class ExtensionHandler(ABC):
                 protect=True  # Protect extension resources
             )
         )
+        
+        # Options shared by unprotected resources and exports under the stack resource
+        self._default_opts = ResourceOptions(parent=self.stack_resource)
             
         self.logger.info(f"Initialized extension {name} in stack {parent_stack_name}")
         
@@ -91,6 +130,60 @@ class ExtensionHandler(ABC):
         if not self.pulumi:
             raise RuntimeError("Extension not properly initialized")
             
+        resource_type, resource_name, full_props, opts = self._resource_spec(
+            resource_type, name, props, parent, depends_on
+        )
+        
+        # Create the resource with proper parenting
+        resource = self.pulumi.create_component_resource(
+            resource_type,
+            resource_name,
+            props=full_props,
+            opts=opts
+        )
+        
+        # Log resource creation
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Created resource: type=%s name=%s parent=%s",
+                resource_type, resource_name, getattr(opts.parent, 'name', None)
+            )
+        
+        return resource
+        
+    def create_resources(
+        self,
+        specs: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]],
+        parent: Optional[Any] = None,
+        depends_on: Optional[list[Any]] = None
+    ) -> List[Any]:
+        """Create several sibling resources in one batch
+        
+        Args:
+            specs: Resource type, name and properties per resource
+            parent: Parent resource of all resources (defaults to stack_resource)
+            depends_on: Resources all resources depend on
+            
+        Returns:
+            Created resources, in input order
+        """
+        if not self.pulumi:
+            raise RuntimeError("Extension not properly initialized")
+            
+        return self.pulumi.create_component_resources([
+            self._resource_spec(resource_type, name, props, parent, depends_on)
+            for resource_type, name, props in specs
+        ])
+        
+    def _resource_spec(
+        self,
+        resource_type: str,
+        name: str,
+        props: Optional[Dict[str, Any]],
+        parent: Optional[Any],
+        depends_on: Optional[list[Any]]
+    ) -> Tuple[str, str, Dict[str, Any], ResourceOptions]:
+        """Get the type, qualified name, properties and options of a resource to create"""
         # Create fully qualified resource name
         resource_name = f"{self.stack_name}.{name}"
         
@@ -109,25 +202,17 @@ class ExtensionHandler(ABC):
             # If no parent is set, use the root stack
             effective_parent = self.pulumi.mock_stack if self.pulumi.mock_mode else self.pulumi.root_stack
             
-        # Create the resource with proper parenting
-        resource = self.pulumi.create_component_resource(
-            resource_type,
-            resource_name,
-            props=full_props,
-            opts=ResourceOptions(
+        # Protect extension resources, checking the extension's own type by identity first
+        protect = resource_type is self._protect_prefix or resource_type.startswith(PROTECTED_TYPE_PREFIX)
+        if effective_parent is self.stack_resource and not depends_on and not protect and self._default_opts:
+            opts = self._default_opts
+        else:
+            opts = ResourceOptions(
                 parent=effective_parent,
                 depends_on=depends_on,
-                protect=resource_type.startswith('pipeline:extension:') # Protect extension resources
+                protect=protect
             )
-        )
-        
-        # Log resource creation
-        self.logger.debug(
-            f"Created resource: type={resource_type} name={resource_name} "
-            f"parent={effective_parent.name if effective_parent else None}"
-        )
-        
-        return resource
+        return resource_type, resource_name, full_props, opts
         
     def export_output(
         self,
@@ -146,18 +231,50 @@ class ExtensionHandler(ABC):
             raise RuntimeError("Extension not properly initialized")
             
         # Store in outputs for state management
-        if name not in self.outputs:
-            self.outputs[name] = []
-        self.outputs[name].append(value)
+        self.outputs.setdefault(name, deque(maxlen=self._max_history)).append(value)
         
+        if self._defer_exports:
+            self._pending_exports[name] = parent
+            return
+            
         # Export via Pulumi with proper resource dependencies
         self.pulumi.export_value(
             f"{self.name}_{name}",
             value,
-            opts=ResourceOptions(parent=parent or self.stack_resource)
+            opts=self._export_opts(parent)
         )
         
-    @abstractmethod
+    @contextmanager
+    def deferred_exports(self) -> Iterator[None]:
+        """Batch export_output calls made inside the block
+        
+        Outputs are still stored immediately, but each output name is only
+        exported once, with its latest value, when the block exits - also
+        when it exits with an exception.
+        """
+        self._defer_exports = True
+        try:
+            yield
+        finally:
+            self._defer_exports = False
+            self.flush_outputs()
+            
+    def flush_outputs(self) -> None:
+        """Export all outputs deferred by deferred_exports"""
+        pending, self._pending_exports = self._pending_exports, {}
+        for name, parent in pending.items():
+            self.pulumi.export_value(
+                f"{self.name}_{name}",
+                self.outputs[name][-1],
+                opts=self._export_opts(parent)
+            )
+            
+    def _export_opts(self, parent: Optional[Any]) -> ResourceOptions:
+        """Get the resource options of an export, reusing the default options when possible"""
+        if (parent is None or parent is self.stack_resource) and self._default_opts:
+            return self._default_opts
+        return ResourceOptions(parent=parent or self.stack_resource)
+        
     def validate_config(self, config: Dict[str, Any]) -> None:
         """Validate extension-specific configuration
         
@@ -166,9 +283,8 @@ class ExtensionHandler(ABC):
         Args:
             config: Raw configuration dictionary from pipeline
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement validate_config")
         
-    @abstractmethod
     def execute(self, config: Dict[str, Any]) -> None:
         """Execute the extension with given configuration
         
@@ -177,7 +293,7 @@ class ExtensionHandler(ABC):
         Args:
             config: Configuration dictionary from pipeline
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement execute")
 
     def get_output_data(self) -> Dict[str, Any]:
         """Get the output data from extension execution
@@ -185,7 +301,7 @@ class ExtensionHandler(ABC):
         Returns:
             Dictionary containing extension output data
         """
-        return self.outputs
+        return {name: list(values) for name, values in self.outputs.items()}
 
     def cleanup(self) -> None:
         """Cleanup extension resources
@@ -199,9 +315,9 @@ class ExtensionHandler(ABC):
                 f"{self.name}_final_state",
                 {
                     "state": self.state,
-                    "outputs": self.outputs
+                    "outputs": self.get_output_data()
                 },
-                opts=ResourceOptions(parent=self.stack_resource)
+                opts=self._export_opts(None)
             )
             # Only clear Pulumi state, keep outputs intact
             self.state.clear()
\ No newline at end of file
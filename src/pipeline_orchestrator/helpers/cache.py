@@ -0,0 +1,20 @@
+"""Cache Helper
+
+Location of the pipeline orchestrator's on-disk cache. Kept free of heavy
+imports so it can be used during startup.
+"""
+from pathlib import Path
+import os
+
+def get_cache_dir(*parts: str) -> Path:
+    """Get a directory inside the pipeline orchestrator cache, creating it if needed
+    
+    The cache lives under $XDG_CACHE_HOME (default ~/.cache).
+    
+    Raises:
+        OSError: If the directory cannot be created
+    """
+    cache_dir = Path(os.getenv("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    cache_dir = cache_dir.joinpath("pipeline_orchestrator", *parts)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
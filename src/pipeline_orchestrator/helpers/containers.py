@@ -2,16 +2,45 @@
 
 Utilities for running commands in containers.
 """
+import logging
 import subprocess
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Set
+
+class ContainerSession:
+    """A long-lived container that commands are executed in"""
+    
+    def __init__(self, container_id: str, image: str):
+        self.container_id = container_id
+        self.image = image
+        
+    def exec_args(self, command: str) -> List[str]:
+        """Get the arguments that execute a command in the container"""
+        return ["docker", "exec", self.container_id, "sh", "-c", command]
+        
+    def exec(self, command: str) -> subprocess.CompletedProcess:
+        """Execute a command in the container
+        
+        Raises:
+            subprocess.CalledProcessError: If the command exits non-zero
+        """
+        return subprocess.run(self.exec_args(command), check=True, capture_output=True, text=True)
 
 class ContainerRunner:
     """Runs commands in containers"""
     
-    @staticmethod
-    def run(command: str, image: str, **kwargs: Dict[str, Any]) -> subprocess.CompletedProcess:
+    DEFAULT_IMAGE = "ubuntu:22.04"
+    
+    # Images pulled by this process
+    _pulled_images: Set[str] = set()
+    
+    @classmethod
+    def run(cls, command: str, image: str, **kwargs: Dict[str, Any]) -> subprocess.CompletedProcess:
         """Run a command in a container
         
+        Use session() instead when running several commands in the same image.
+        
         Args:
             command: Command to execute
             image: Container image to use
@@ -20,5 +49,64 @@ class ContainerRunner:
         Returns:
             CompletedProcess instance with command output
         """
-        # TODO: Implement container runtime logic
-        raise NotImplementedError("Container support not implemented yet") 
\ No newline at end of file
+        with cls.session(image) as session:
+            return session.exec(command)
+            
+    @staticmethod
+    @contextmanager
+    def session(image: str, mounts: Iterable[str] = ()) -> Iterator[ContainerSession]:
+        """Start a container that stays up for the duration of the context
+        
+        Commands are executed in it with `docker exec`, avoiding a container
+        start per command. The container is removed on exit.
+        
+        Args:
+            image: Container image to use
+            mounts: Host directories mounted read-only at the same path in the container
+        """
+        logger = logging.getLogger("pipeline.containers")
+        volumes = [arg for path in mounts for arg in ("-v", f"{path}:{path}:ro")]
+        result = subprocess.run(
+            ["docker", "run", "-d", "--rm", *volumes, "--entrypoint", "sleep", image, "infinity"],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        container_id = result.stdout.strip()
+        logger.info(f"Started container {container_id[:12]} from {image}")
+        try:
+            yield ContainerSession(container_id, image)
+        finally:
+            subprocess.run(["docker", "rm", "-f", container_id], capture_output=True)
+            logger.info(f"Removed container {container_id[:12]}")
+        
+    @classmethod
+    def pull_images(cls, images: Iterable[str]) -> None:
+        """Pull container images in parallel
+        
+        Best-effort cache warming: failures are logged and ignored, and
+        images already pulled by this process are skipped.
+        
+        Args:
+            images: Container images to pull
+        """
+        pending = set(images) - cls._pulled_images
+        if not pending:
+            return
+            
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            for image, pulled in zip(pending, executor.map(cls._pull_image, pending)):
+                if pulled:
+                    cls._pulled_images.add(image)
+                    
+    @staticmethod
+    def _pull_image(image: str) -> bool:
+        """Pull a single container image, returning whether it succeeded"""
+        logger = logging.getLogger("pipeline.containers")
+        try:
+            subprocess.run(["docker", "pull", image], check=True, capture_output=True, text=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"Could not pre-pull image {image}: {e}")
+            return False
+        logger.info(f"Pre-pulled image {image}")
+        return True
@@ -2,39 +2,375 @@
 
 Utilities for downloading and managing remote resources.
 """
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple, Union
 from pathlib import Path
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+import threading
+import urllib.error
+import urllib.parse
 import urllib.request
 
+from pipeline_orchestrator.helpers.cache import get_cache_dir
 from pipeline_orchestrator.helpers.models import AuthConfig
 
+# Paths are accepted as str internally and only wrapped in Path when returned
+PathLike = Union[str, os.PathLike]
+
+# Bytes copied at a time when streaming downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Upper bound on resources downloaded at the same time
+MAX_PARALLEL_DOWNLOADS = 8
+
+# HTTP statuses that are left to urllib to follow
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+# Response headers identifying a version of a resource, and the request
+# headers they are sent back in to revalidate a cached copy
+VALIDATOR_HEADERS = {'ETag': 'If-None-Match', 'Last-Modified': 'If-Modified-Since'}
+
+class _HTTPConnections(threading.local):
+    """Open HTTP connections of the current thread, by scheme and host"""
+    
+    def __init__(self):
+        self.connections: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+
+_HTTP_CONNECTIONS = _HTTPConnections()
+
+def copy_file(source: PathLike, target: PathLike) -> None:
+    """Copy a file, letting the kernel copy the data where supported
+    
+    Uses os.copy_file_range, which reflinks on copy-on-write filesystems
+    and otherwise copies without passing data through userspace. Falls
+    back to shutil.copyfile when it is unavailable or unsupported.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source, 'rb') as src, open(target, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                else:
+                    return
+        except OSError:
+            pass
+    shutil.copyfile(source, target)
+
+# Location prefixes of resources that are fetched rather than used in place
+REMOTE_PREFIXES = ('http://', 'https://', 'git@')
+
+def download(location: str, target: PathLike, auth: Optional[AuthConfig] = None) -> Path:
+    """Download a resource from URL or git to specified target path
+    
+    Args:
+        location: Resource location (URL, git URL, or local path)
+        target: Path where to save the downloaded resource
+        auth: Optional authentication configuration
+        
+    Returns:
+        Path to downloaded resource (same as target)
+    """
+    if location.startswith(('http://', 'https://')):
+        return Path(_download_http(location, os.fspath(target), auth))
+                
+    elif location.startswith('git@'):
+        return Path(_download_git(location, os.fspath(target), auth))
+        
+    return resolve_local(location)
+
+def _download_http(location: str, target: str, auth: Optional[AuthConfig] = None) -> str:
+    """Stream an HTTP(S) resource to the target path"""
+    _fetch_http(location, target, auth)
+    return target
+
+def _fetch_http(
+    location: str,
+    target: str,
+    auth: Optional[AuthConfig] = None,
+    validators: Optional[Dict[str, str]] = None
+) -> Optional[Dict[str, str]]:
+    """Stream an HTTP(S) resource to the target path, unless not modified
+    
+    The body is copied in chunks rather than read into memory, and
+    gzip transfer encoding is requested and decoded while streaming.
+    
+    Args:
+        location: Resource URL
+        target: Path where to save the resource
+        auth: Optional authentication configuration
+        validators: ETag and Last-Modified of a cached copy, to only
+            download the resource if it changed since
+            
+    Returns:
+        Validators of the downloaded resource, or None if it was not
+        modified and nothing was written
+    """
+    headers = {'Accept-Encoding': 'gzip'}
+    for name, value in (validators or {}).items():
+        if name in VALIDATOR_HEADERS:
+            headers[VALIDATOR_HEADERS[name]] = value
+    if auth and auth.headers:
+        headers.update(auth.headers)
+        
+    try:
+        response = _open_http(location, headers)
+    except urllib.error.HTTPError as e:
+        if e.code == http.client.NOT_MODIFIED:
+            e.close()
+            return None
+        raise
+        
+    with response:
+        if response.status == http.client.NOT_MODIFIED:
+            response.read()
+            return None
+        with open(target, 'wb') as file:
+            body = response
+            if response.headers.get('Content-Encoding', '').lower() == 'gzip':
+                body = gzip.GzipFile(fileobj=response)
+            shutil.copyfileobj(body, file, length=DOWNLOAD_CHUNK_SIZE)
+        # Drain anything left so the connection can be reused
+        response.read()
+        return {name: response.headers[name] for name in VALIDATOR_HEADERS if response.headers.get(name)}
+
+def _download_git(location: str, target: str, auth: Optional[AuthConfig] = None) -> str:
+    """Check out a git repository at the target path
+    
+    An existing checkout is fast-forwarded with a single `git pull`,
+    otherwise a shallow clone is made. An SSH key from the authentication
+    configuration is passed to ssh.
+    
+    Returns:
+        Path to the checkout (same as target)
+        
+    Raises:
+        subprocess.CalledProcessError: If git fails
+    """
+    env = None
+    if auth and auth.ssh_key:
+        env = {**os.environ, 'GIT_SSH_COMMAND': f"ssh -i {shlex.quote(auth.ssh_key)} -o IdentitiesOnly=yes"}
+        
+    if os.path.isdir(os.path.join(target, '.git')):
+        command = ['git', '-C', target, 'pull', '--ff-only', '--quiet']
+    else:
+        command = ['git', 'clone', '--depth', '1', '--quiet', location, target]
+    subprocess.run(command, check=True, capture_output=True, text=True, env=env)
+    return target
+
+def _open_http(location: str, headers: Dict[str, str]):
+    """Send a GET request, reusing this thread's connection to the host
+    
+    Requests needing a proxy or credentials in the URL, and redirects,
+    are handled by urllib without connection reuse.
+    
+    Raises:
+        urllib.error.HTTPError: If the server responds with an error status
+    """
+    url = urllib.parse.urlsplit(location)
+    if url.username or urllib.request.getproxies():
+        return urllib.request.urlopen(urllib.request.Request(location, headers=headers))
+        
+    path = url.path or '/'
+    if url.query:
+        path = f"{path}?{url.query}"
+        
+    key = (url.scheme, url.netloc)
+    connections = _HTTP_CONNECTIONS.connections
+    while True:
+        connection = connections.get(key)
+        reused = connection is not None
+        if not reused:
+            connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+            connection = connections[key] = connection_class(url.netloc)
+        try:
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+            break
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            del connections[key]
+            if not reused:
+                raise
+            # The server closed the idle connection, retry on a new one
+            
+    if response.status in REDIRECT_STATUSES:
+        response.read()
+        return urllib.request.urlopen(urllib.request.Request(location, headers=headers))
+    if response.status >= 400:
+        response.read()
+        raise urllib.error.HTTPError(location, response.status, response.reason, response.headers, None)
+    return response
+
+def resolve_local(location: str, listings: Optional[Dict[str, Set[str]]] = None) -> Path:
+    """Resolve a local path or file:// URL to an existing file
+    
+    Args:
+        location: Local path or file:// URL
+        listings: Entry names by absolute directory path, shared by the
+            lookups of one batch so each directory is scanned once
+    
+    Raises:
+        FileNotFoundError: If the resource does not exist
+    """
+    if location.startswith('file://'):
+        location = urllib.request.url2pathname(urllib.parse.urlparse(location).path)
+        
+    if listings is None:
+        if not os.path.exists(location):
+            raise FileNotFoundError(f"Resource not found: {location}")
+        return Path(location)
+        
+    parent, name = os.path.split(os.path.abspath(location))
+    entries = listings.get(parent)
+    if entries is None:
+        try:
+            with os.scandir(parent) as scan:
+                entries = {entry.name for entry in scan}
+        except OSError:
+            entries = set()
+        listings[parent] = entries
+            
+    if name not in entries:
+        raise FileNotFoundError(f"Resource not found: {location}")
+    return Path(location)
+
 class ResourceDownloader:
-    """Downloads resources from various sources"""
+    """Downloads resources from various sources
+    
+    Facade over the module-level download functions.
+    """
+    
+    download = staticmethod(download)
+    resolve_local = staticmethod(resolve_local)
+    
+    @classmethod
+    def download_many(cls, items: List[Tuple[str, Path, Optional[AuthConfig]]]) -> List[Path]:
+        """Download several resources in parallel
+        
+        Local resources are looked up in directory listings scanned once
+        for the whole batch.
+        
+        Args:
+            items: Location, target path and optional authentication per resource
+            
+        Returns:
+            Path of each downloaded resource, in input order
+        """
+        listings: Dict[str, Set[str]] = {}
+        
+        def fetch(item: Tuple[str, Path, Optional[AuthConfig]]) -> Path:
+            if item[0].startswith(REMOTE_PREFIXES):
+                return cls.download(*item)
+            return resolve_local(item[0], listings)
+            
+        if len(items) <= 1:
+            return [fetch(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DOWNLOADS, len(items))) as executor:
+            return list(executor.map(fetch, items))
+
+class CachedResourceDownloader(ResourceDownloader):
+    """Downloads remote resources through a persistent on-disk cache
+    
+    Entries are keyed by location and authentication. A cached entry is
+    revalidated with ETag / Last-Modified once per process, so unchanged
+    resources are not transferred again while upstream changes are picked
+    up on the next run. Local paths and git locations are passed straight
+    through to ResourceDownloader, and remote resources are downloaded
+    directly when the cache directory is not usable.
+    """
+    
+    CACHE_SUBDIR = "scripts"
+    
+    # Cache keys revalidated by this process
+    _revalidated: Set[str] = set()
     
     @staticmethod
-    def download(location: str, target: Path, auth: Optional[AuthConfig] = None) -> Path:
-        """Download a resource from URL or git to specified target path
+    def cache_key(location: str, auth: Optional[AuthConfig] = None) -> str:
+        """Get the cache key for a location and its authentication"""
+        auth_bytes = repr(auth).encode() if auth else b""
+        return hashlib.blake2b(location.encode() + auth_bytes, digest_size=16).hexdigest()
+    
+    @classmethod
+    def download(cls, location: str, target: PathLike, auth: Optional[AuthConfig] = None) -> Path:
+        """Download a resource, reusing a cached copy when available
         
         Args:
             location: Resource location (URL, git URL, or local path)
-            target: Path where to save the downloaded resource
+            target: Path where to place the downloaded resource
             auth: Optional authentication configuration
             
         Returns:
-            Path to downloaded resource (same as target)
+            Path to downloaded resource
         """
-        if location.startswith(('http://', 'https://')):
-            request = urllib.request.Request(location)
-            if auth and auth.headers:
-                for key, value in auth.headers.items():
-                    request.add_header(key, value)
-                    
-            with urllib.request.urlopen(request) as response:
-                target.write_bytes(response.read())
-                return target
-                    
-        elif location.startswith('git@'):
-            # TODO: Implement git clone with auth support
-            raise NotImplementedError("Git support not implemented yet")
-            
-        return Path(location)
\ No newline at end of file
+        if not location.startswith(('http://', 'https://')):
+            return download(location, target, auth)
+            
+        try:
+            cache_dir = os.fspath(get_cache_dir(cls.CACHE_SUBDIR))
+        except OSError:
+            # The cache is optional, download straight to the target
+            return download(location, target, auth)
+            
+        key = cls.cache_key(location, auth)
+        cached = os.path.join(cache_dir, key)
+        if key not in cls._revalidated or not os.path.exists(cached):
+            try:
+                # Download next to the cache entry and move it in place atomically
+                fd, partial = tempfile.mkstemp(dir=cache_dir, prefix=f"{key}.", suffix=".part")
+            except OSError:
+                return download(location, target, auth)
+            os.close(fd)
+            try:
+                validators = cls._read_validators(cached) if os.path.exists(cached) else None
+                validators = _fetch_http(location, partial, auth, validators)
+                if validators is not None:
+                    os.replace(partial, cached)
+                    cls._write_validators(cached, validators)
+            finally:
+                if os.path.exists(partial):
+                    os.unlink(partial)
+            cls._revalidated.add(key)
+            
+        target = os.fspath(target)
+        if os.path.lexists(target):
+            os.unlink(target)
+        try:
+            # Hardlink when cache and target share a filesystem
+            os.link(cached, target)
+        except OSError:
+            copy_file(cached, target)
+        return Path(target)
+    
+    @staticmethod
+    def _read_validators(cached: str) -> Optional[Dict[str, str]]:
+        """Read the validators stored with a cache entry, if any"""
+        try:
+            with open(f"{cached}.meta") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+            
+    @staticmethod
+    def _write_validators(cached: str, validators: Dict[str, str]) -> None:
+        """Store the validators of a cache entry, removing stale ones"""
+        meta = f"{cached}.meta"
+        try:
+            if validators:
+                with open(meta, 'w') as file:
+                    json.dump(validators, file)
+            elif os.path.exists(meta):
+                os.unlink(meta)
+        except OSError:
+            pass
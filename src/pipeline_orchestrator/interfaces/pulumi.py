@@ -1,13 +1,21 @@
 """Pulumi Interface - Abstraction layer for Pulumi SDK operations"""
 
 import os
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 import pulumi
 from pipeline_orchestrator.interfaces.testing import MockResource, MockStackReference
 import logging
 
+# Prop types exposed on resources as is, without wrapping in an Output
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+# Shared options for resources created without options, never mutated
+_EMPTY_OPTS = pulumi.ResourceOptions()
+
 class ResourceOptions:
     """Resource options abstraction to avoid direct Pulumi SDK usage"""
+    __slots__ = ('parent', 'depends_on', 'protect')
+    
     def __init__(
         self,
         parent: Optional[Union['MockResource', pulumi.Resource]] = None,
@@ -42,8 +50,10 @@ class PulumiInterface:
         self.mock_mode = mock_mode
         self.mock_outputs: Dict[str, Any] = {}
         self.mock_stack: Optional[MockResource] = None
-        self.mock_resources: Dict[str, MockResource] = {}
+        self.mock_resources: Dict[str, MockResource] = {}  # Mock resources by URN
+        self._mock_resources_by_name: Optional[Dict[str, MockResource]] = None  # Built by get_mock_resource
         self.root_stack: Optional[Union[MockResource, pulumi.Resource]] = None
+        self._resource_tree: Optional[Dict[str, Any]] = None  # Built by get_resource_tree
         self.logger = logging.getLogger("pipeline.pulumi")
         
         if not mock_mode:
@@ -67,8 +77,7 @@ class PulumiInterface:
             )
             self.root_stack = self.mock_stack
             # Track root stack
-            self.mock_resources[self._stack_name] = self.mock_stack
-            self.mock_resources[f"urn:mock:pulumi:stack:Stack::{self._stack_name}"] = self.mock_stack
+            self.mock_resources[self.mock_stack.urn] = self.mock_stack
             self.logger.info(
                 f"Initialized in mock mode: stack={self._stack_name} "
                 f"mock_stack={self.mock_stack}"
@@ -120,7 +129,8 @@ class PulumiInterface:
         resource_type: str,
         name: str,
         props: Optional[Dict[str, Any]] = None,
-        opts: Optional[ResourceOptions] = None
+        opts: Optional[ResourceOptions] = None,
+        attach: bool = True
     ) -> Union[MockResource, pulumi.ComponentResource]:
         """Create a new component resource
         
@@ -129,42 +139,48 @@ class PulumiInterface:
             name: Name of resource
             props: Resource properties
             opts: Resource options
+            attach: Add a mock resource to its parent's children (mock mode only)
         """
-        self.logger.info(f"Creating component resource: type={resource_type} name={name}")
-        self.logger.debug(f"Resource properties: {props}")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        self.logger.info("Creating component resource: type=%s name=%s", resource_type, name)
+        if debug:
+            self.logger.debug("Resource properties: %s", props)
         
-        pulumi_opts = opts.to_pulumi_options() if opts else pulumi.ResourceOptions()
-        self.logger.debug(f"Resource options: parent={pulumi_opts.parent} protect={pulumi_opts.protect}")
+        if opts is None:
+            pulumi_opts = _EMPTY_OPTS
+        else:
+            pulumi_opts = opts.to_pulumi_options()
+        if debug:
+            self.logger.debug("Resource options: parent=%s protect=%s", pulumi_opts.parent, pulumi_opts.protect)
         
         # Only set default parent in mock mode
         if self.mock_mode and pulumi_opts.parent is None and not resource_type.startswith("pulumi:stack:"):
-            pulumi_opts.parent = self.root_stack
-            self.logger.info(
-                f"Setting default parent for {name}: parent={self.root_stack}"
-            )
+            if pulumi_opts is _EMPTY_OPTS:
+                pulumi_opts = pulumi.ResourceOptions(parent=self.root_stack)
+            else:
+                pulumi_opts.parent = self.root_stack
+            self.logger.info("Setting default parent for %s: parent=%s", name, self.root_stack)
         
         if self.mock_mode:
             # Create and track mock resource
-            mock_resource = MockResource(resource_type, name, props or {}, pulumi_opts)
+            mock_resource = MockResource(resource_type, name, props or {}, pulumi_opts, attach)
             
             # Track by URN for proper hierarchy
             self.mock_resources[mock_resource.urn] = mock_resource
-            
-            # Also track by name for backward compatibility
-            self.mock_resources[name] = mock_resource
+            self._mock_resources_by_name = None
+            self._resource_tree = None
             
             self.logger.info(
-                f"Created mock resource: type={resource_type} name={name} "
-                f"urn={mock_resource.urn}"
+                "Created mock resource: type=%s name=%s urn=%s",
+                resource_type, name, mock_resource.urn
             )
-            self.logger.debug(f"Mock resource parent hierarchy: {mock_resource.parent}")
+            if debug:
+                self.logger.debug("Mock resource parent hierarchy: %s", mock_resource.parent)
             
             return mock_resource
             
         # Create real Pulumi resource with proper registration
-        self.logger.info(
-            f"Creating real Pulumi resource: type={resource_type} name={name}"
-        )
+        self.logger.info("Creating real Pulumi resource: type=%s name=%s", resource_type, name)
         
         try:
             # First register the resource with Pulumi
@@ -175,32 +191,60 @@ class PulumiInterface:
                 pulumi_opts
             )
             
-            self.logger.info(
-                f"Created Pulumi resource: type={resource_type} name={name} "
-                f"urn={getattr(resource, 'urn', None)}"
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Created Pulumi resource: type=%s name=%s urn=%s",
+                    resource_type, name, getattr(resource, 'urn', None)
+                )
             
-            # Register all props as outputs to ensure they're tracked
+            # Expose props as resource attributes in one update, bypassing __setattr__.
+            # Primitives need no async resolution and are set unwrapped.
             if props:
-                self.logger.debug(f"Registering resource properties: {list(props.keys())}")
-                for key, value in props.items():
-                    try:
-                        output = pulumi.Output.from_input(value)
-                        setattr(resource, key, output)
-                        self.logger.debug(f"Registered property {key} for {name}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to register property {key} for {name}: {e}")
+                if debug:
+                    self.logger.debug("Registering resource properties: %s", list(props.keys()))
+                resource.__dict__.update(
+                    (key, value if isinstance(value, _PRIMITIVE_TYPES) else pulumi.Output.from_input(value))
+                    for key, value in props.items()
+                )
             
             # Register resource outputs using the resource's register_outputs method
             resource.register_outputs(props or {})
-            self.logger.info(f"Successfully registered resource outputs: {name}")
+            self.logger.info("Successfully registered resource outputs: %s", name)
             
             return resource
             
         except Exception as e:
-            self.logger.error(f"Failed to create Pulumi resource {name}: {e}", exc_info=True)
+            self.logger.error("Failed to create Pulumi resource %s: %s", name, e, exc_info=True)
             raise
         
+    def create_component_resources(
+        self,
+        specs: Iterable[Tuple[str, str, Optional[Dict[str, Any]], Optional[ResourceOptions]]]
+    ) -> List[Union[MockResource, pulumi.ComponentResource]]:
+        """Create several component resources
+        
+        In mock mode the resources are added to their parents' children
+        in one batch per parent.
+        
+        Args:
+            specs: Resource type, name, properties and options per resource
+            
+        Returns:
+            Created resources, in input order
+        """
+        if not self.mock_mode:
+            return [self.create_component_resource(*spec) for spec in specs]
+            
+        resources = [self.create_component_resource(*spec, attach=False) for spec in specs]
+        siblings: Dict[str, Tuple[MockResource, List[MockResource]]] = {}  # Children by parent URN
+        for resource in resources:
+            parent = resource.parent
+            if parent is not None:
+                siblings.setdefault(parent.urn, (parent, []))[1].append(resource)
+        for parent, children in siblings.values():
+            parent.add_children(children)
+        return resources
+        
     def export_value(
         self, 
         name: str, 
@@ -231,24 +275,62 @@ class PulumiInterface:
         return pulumi.StackReference(stack_name)
         
     def get_mock_resource(self, name: str) -> Optional[MockResource]:
-        """Get a mock resource by name (mock mode only)"""
-        return self.mock_resources.get(name)
+        """Get a mock resource by URN or name (mock mode only)
+        
+        The name index is built on the first lookup by name after a
+        resource is created. When names are shared, the most recently
+        created resource is returned.
+        """
+        resource = self.mock_resources.get(name)
+        if resource is not None:
+            return resource
+        if self._mock_resources_by_name is None:
+            self._mock_resources_by_name = {
+                resource.name: resource for resource in self.mock_resources.values()
+            }
+        return self._mock_resources_by_name.get(name)
         
+    def iter_resource_tree(self) -> Iterator[Tuple[int, MockResource]]:
+        """Walk the resource tree in mock mode, depth first
+        
+        Yields (depth, resource) pairs, parents before their children,
+        without building the tree.
+        """
+        if not self.mock_mode or not self.mock_stack:
+            return
+            
+        stack = [(0, self.mock_stack)]
+        while stack:
+            depth, resource = stack.pop()
+            yield depth, resource
+            stack.extend((depth + 1, child) for child in reversed(resource.get_children()))
+            
     def get_resource_tree(self) -> Dict[str, Any]:
         """Get the full resource tree in mock mode
         
-        Returns a dictionary representing the resource hierarchy
+        Returns a dictionary representing the resource hierarchy. The tree
+        is built once and reused until another resource is created.
         """
-        if not self.mock_mode or not self.mock_stack:
-            return {}
+        if self._resource_tree is not None:
+            return self._resource_tree
             
-        def build_tree(resource: MockResource) -> Dict[str, Any]:
-            return {
+        tree: Dict[str, Any] = {}
+        path = []  # Nodes from the root to the last visited resource
+        for depth, resource in self.iter_resource_tree():
+            node = {
                 'type': resource.resource_type,
                 'name': resource.name,
                 'props': resource.props,
                 'urn': resource.urn,
-                'children': [build_tree(child) for child in resource.get_children()]
+                'children': []
             }
+            del path[depth:]
+            if path:
+                path[-1]['children'].append(node)
+            else:
+                tree = node
+            path.append(node)
             
-        return build_tree(self.mock_stack)
\ No newline at end of file
+        if self.mock_mode and self.mock_stack:
+            self._resource_tree = tree
+        return tree
\ No newline at end of file
@@ -3,11 +3,14 @@
 Provides mock implementations of Pulumi resources for testing.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from dataclasses import InitVar, dataclass, field
+from typing import Dict, Any, Iterable, Optional, List
 import logging
+import sys
 from pulumi import ResourceOptions
 
+_STACK_TYPE = sys.intern("pulumi:stack:Stack")
+
 @dataclass
 class MockResource:
     """Mock implementation of Pulumi ComponentResource"""
@@ -15,26 +18,27 @@ class MockResource:
     name: str
     props: Dict[str, Any]
     opts: Optional[ResourceOptions] = None
+    attach: InitVar[bool] = True  # Add to the parent's children, False when the caller adds it in a batch
     _is_stack: bool = field(init=False, default=False)
     _outputs: Dict[str, Any] = field(default_factory=dict)
-    _children: List['MockResource'] = field(default_factory=list)
+    _children: Dict[str, 'MockResource'] = field(default_factory=dict)  # Child resources by URN
     _urn: str = field(init=False)
     _logger: logging.Logger = field(init=False)
 
-    def __post_init__(self):
+    def __post_init__(self, attach: bool):
         """Initialize instance variables"""
-        self._is_stack = self.resource_type == "pulumi:stack:Stack"
-        self._urn = f"urn:mock:{self.resource_type}::{self.name}"
+        self._is_stack = self.resource_type == _STACK_TYPE
+        self._urn = sys.intern(f"urn:mock:{self.resource_type}::{self.name}")
         self._logger = logging.getLogger("mock.resources")
         
         # If we have a parent, add ourselves as their child
-        if self.opts and self.opts.parent:
+        if attach and self.opts and self.opts.parent:
             parent = self.opts.parent
             if isinstance(parent, MockResource):
                 parent.add_child(self)
             else:
                 self._logger.warning(
-                    f"Parent of {self.resource_type}:{self.name} is not a MockResource"
+                    "Parent of %s:%s is not a MockResource", self.resource_type, self.name
                 )
                 
     def add_child(self, child: 'MockResource') -> None:
@@ -42,12 +46,16 @@ class MockResource:
         
         This is the single point of truth for managing parent-child relationships.
         """
-        self._logger.debug(
-            f"Adding child {child.resource_type}:{child.name} to "
-            f"{self.resource_type}:{self.name}"
-        )
-        if child not in self._children:
-            self._children.append(child)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Adding child %s:%s to %s:%s",
+                child.resource_type, child.name, self.resource_type, self.name
+            )
+        self._children.setdefault(child.urn, child)
+        
+    def add_children(self, children: Iterable['MockResource']) -> None:
+        """Add several child resources in one update"""
+        self._children.update((child.urn, child) for child in children)
 
     def is_stack(self) -> bool:
         """Check if this is a stack resource"""
@@ -65,7 +73,7 @@ class MockResource:
         
     def get_children(self) -> List['MockResource']:
         """Get child resources"""
-        return self._children
+        return list(self._children.values())
         
     @property
     def urn(self) -> str:
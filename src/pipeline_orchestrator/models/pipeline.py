@@ -1,50 +1,261 @@
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, ConfigDict, RootModel
+from collections import OrderedDict
+from functools import cached_property
+from typing import ClassVar, Dict, Optional, Any, Tuple, TypedDict, Union
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, RootModel, TypeAdapter, model_validator, with_config
 from pathlib import Path
+import copy
+import hashlib
+import json
+import os
+import sys
 
-class ExecutionDefaults(BaseModel):
-    """Default execution settings"""
+# Build configurations from trusted input without validation, see from_trusted
+TRUSTED_CONFIG = os.getenv("PIPELINE_TRUSTED_CONFIG") == "1"
+
+# Key of the core model in a pipeline body
+_CORE = sys.intern('core')
+
+# Number of validated configurations kept by load_cached
+CONFIG_CACHE_SIZE = 16
+
+# Exception names retried by default, shared by all ExecutionDefaults
+DEFAULT_RETRY_ON_EXCEPTIONS = ("ConnectionError", "TimeoutError")
+
+def load_yaml(data: Union[str, bytes]) -> Any:
+    """Parse a YAML document, with libyaml's C loader when available"""
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return yaml.load(data, Loader=Loader)
+
+def _intern_keys(data: Any) -> Any:
+    """Intern the pipeline and extension names of a raw configuration
+    
+    Names are compared and looked up repeatedly while the configuration is
+    processed, interning lets those checks succeed on identity.
+    """
+    if not isinstance(data, dict):
+        return data
+    return {
+        sys.intern(name) if isinstance(name, str) else name: {
+            sys.intern(key) if isinstance(key, str) else key: value
+            for key, value in body.items()
+        } if isinstance(body, dict) else body
+        for name, body in data.items()
+    }
+
+# Field value types that can change in place, even on a frozen model
+_MUTABLE_TYPES = (dict, list, set)
+
+class FrozenModel(BaseModel):
+    """Base of immutable configuration models
+    
+    Instances hash by their immutable field values, so they can be used as
+    dict keys and for memoization. Dict, list and set values and extra
+    fields can still be changed in place and are left out of the hash;
+    equal instances still hash equal.
+    """
+    model_config = ConfigDict(frozen=True)
+    
+    def __hash__(self) -> int:
+        return hash((
+            type(self),
+            tuple(
+                value for name in type(self).model_fields
+                if not isinstance(value := getattr(self, name), _MUTABLE_TYPES)
+            )
+        ))
+        
+    def with_overrides(self, **overrides: Any) -> 'FrozenModel':
+        """Get a copy with some fields replaced, the values are not validated"""
+        return self.model_copy(update=overrides)
+
+class ExecutionDefaults(FrozenModel):
+    """Default execution settings
+    
+    Immutable and without extra fields, so instances can be shared and
+    carry no extras dict.
+    """
+    model_config = ConfigDict(defer_build=True, frozen=True, extra='forbid')
+    
     timeout_seconds: int = 300
     max_attempts: int = 3
     delay_seconds: int = 5
     exponential_backoff: bool = True
-    retry_on_exceptions: List[str] = Field(default_factory=lambda: ["ConnectionError", "TimeoutError"])
+    retry_on_exceptions: Tuple[str, ...] = DEFAULT_RETRY_ON_EXCEPTIONS
     retry: Optional[Dict[str, Any]] = None
+    _default: ClassVar[Optional['ExecutionDefaults']] = None  # Shared instance returned by fast()
+    
+    @classmethod
+    def fast(cls, **overrides: Any) -> 'ExecutionDefaults':
+        """Get execution defaults without per-call validation
+        
+        Without overrides a single validated instance is shared, which is
+        safe since the model is frozen. Overrides are trusted and set with
+        model_construct, without validation.
+        """
+        if overrides:
+            return cls.model_construct(**overrides)
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
 
-class CoreConfig(BaseModel):
-    """Core pipeline model"""
-    execution_defaults: ExecutionDefaults = Field(default_factory=ExecutionDefaults)
-    extension_dir: Path = Field(default=Path("extensions"))
+class CoreConfig(FrozenModel):
+    """Core pipeline model
+    
+    Immutable, use with_overrides to derive a changed configuration.
+    """
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
+    execution_defaults: ExecutionDefaults = Field(default_factory=ExecutionDefaults.fast)
+    extension_dir: str = "extensions"
+    
+    @cached_property
+    def extension_dir_path(self) -> Path:
+        """Extension directory as a Path, built on first access"""
+        return Path(self.extension_dir)
+        
+    def with_overrides(self, **overrides: Any) -> 'CoreConfig':
+        """Get a copy with some fields replaced, the values are not validated"""
+        core = super().with_overrides(**overrides)
+        core.__dict__.pop('extension_dir_path', None)  # Rebuilt from the new fields on access
+        return core
+    
+    @classmethod
+    def from_trusted(cls, data: Union['CoreConfig', Dict[str, Any]]) -> 'CoreConfig':
+        """Build from trusted data without validation"""
+        if isinstance(data, cls):
+            return data
+        fields = dict(data)
+        if isinstance(fields.get('execution_defaults'), dict):
+            fields['execution_defaults'] = ExecutionDefaults.model_construct(**fields['execution_defaults'])
+        return cls.model_construct(**fields)
+
+# Items of one extension type, keyed by item name
+ExtensionItems = Dict[str, Dict[str, Any]]
 
-class PipelineDefinition(BaseModel):
-    """Pipeline definition - core model and extensions"""
-    model_config = ConfigDict(extra='allow')
+class PipelineDefinition(FrozenModel):
+    """Pipeline definition - core model and extensions
+    
+    Immutable, use with_overrides to derive a changed definition. The
+    extension item dicts themselves are not frozen, and so not hashed.
+    """
+    model_config = ConfigDict(defer_build=True, frozen=True, extra='allow')
     
     core: CoreConfig
-    extensions: Dict[str, Dict] = Field(default_factory=dict)
+    extensions: Dict[str, ExtensionItems] = Field(default_factory=dict)
+    
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'PipelineDefinition':
+        """Build from trusted data without validation
+        
+        Nested models are built with model_construct as well, so values are
+        neither checked nor coerced. Use model_validate for user input.
+        """
+        return cls.model_construct(**{**data, 'core': CoreConfig.from_trusted(data.get('core') or {})})
+        
+    def to_raw(self, *, exclude_defaults: bool = True) -> Dict[str, Any]:
+        """Serialize back to a plain dict
+        
+        Args:
+            exclude_defaults: Leave out fields that were not set or hold their default
+        """
+        return self.model_dump(exclude_unset=exclude_defaults, exclude_defaults=exclude_defaults)
 
 class PipelineConfig(RootModel):
     """Root configuration - allows any pipeline name as key"""
+    model_config = ConfigDict(defer_build=True)
+    
     root: Dict[str, PipelineDefinition]
+    _first: Optional[PipelineDefinition] = PrivateAttr(default=None)  # The only pipeline
+    
+    @model_validator(mode='after')
+    def _cache_first(self) -> 'PipelineConfig':
+        """Check for a pipeline and keep it for get_pipeline"""
+        if not self.root:
+            raise ValueError("Configuration must define a pipeline")
+        self._first = next(iter(self.root.values()))
+        return self
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Dict[str, Any]]) -> 'PipelineConfig':
+        """Build from trusted data without validation"""
+        config = cls.model_construct(
+            root={name: PipelineDefinition.from_trusted(pipeline) for name, pipeline in data.items()}
+        )
+        config._first = next(iter(config.root.values()))
+        return config
+        
     def get_pipeline(self) -> PipelineDefinition:
         """Get the first pipeline definition (since we only support one for now)"""
-        return next(iter(self.root.values()))
+        return self._first
 
-class PipelineRawConfig(RootModel):
-    """Raw pipeline configuration from YAML
+# Validated configurations by content hash, least recently used first
+_CONFIG_CACHE: 'OrderedDict[bytes, PipelineConfig]' = OrderedDict()
+
+def load_cached(raw: Dict[str, Any]) -> PipelineConfig:
+    """Validate a pipeline configuration, reusing the result for identical content
     
-    This model represents the raw YAML structure where everything is at the
-    root level, before being transformed into the proper PipelineDefinition
-    structure with extensions.
+    Configurations are keyed by a SHA-256 hash of their canonical JSON, so
+    reloading unchanged content skips validation. Each call returns its own
+    copy of the extension data, which extensions may modify.
     """
-    root: Dict[str, Dict[str, Any]]
-    
-    def get_extensions(self) -> Dict[str, Any]:
-        """Get all extensions from the raw configuration"""
-        pipeline = next(iter(self.root.values()))
-        return {
-            name: config
-            for name, config in pipeline.items()
-            if name != 'core'
-        }
+    try:
+        key = hashlib.sha256(json.dumps(raw, sort_keys=True, default=repr).encode()).digest()
+    except (TypeError, ValueError):
+        # Keys that cannot be sorted or serialized, validate without caching
+        return PipelineConfig(root=raw)
+        
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        config = _CONFIG_CACHE[key] = PipelineConfig(root=raw)
+        if len(_CONFIG_CACHE) > CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
+    else:
+        _CONFIG_CACHE.move_to_end(key)
+    return _isolate_extensions(config)
+
+def _isolate_extensions(config: PipelineConfig) -> PipelineConfig:
+    """Get a copy of a configuration with its own extension data"""
+    isolated = PipelineConfig.model_construct(root={
+        name: pipeline.with_overrides(extensions=copy.deepcopy(pipeline.extensions))
+        for name, pipeline in config.root.items()
+    })
+    isolated._first = next(iter(isolated.root.values()))
+    return isolated
+
+@with_config(ConfigDict(extra='allow'))
+class RawPipelineBody(TypedDict, total=False):
+    """Raw pipeline body - core model next to extension item lists"""
+    core: CoreConfig
+
+# Schemas are deferred above and built once here for the root model,
+# nested models are inlined into it instead of being built on their own
+if not PipelineConfig.__pydantic_complete__:
+    PipelineConfig.model_rebuild()
+
+# Validates raw configurations as plain dicts, without a RootModel wrapper
+RAW_CONFIG_ADAPTER = TypeAdapter(Dict[str, RawPipelineBody])
+
+def load_raw_config(data: Any) -> Dict[str, RawPipelineBody]:
+    """Validate a raw configuration parsed from YAML
+    
+    In the raw structure extension item lists sit next to core in the
+    pipeline body, before being transformed into a PipelineDefinition.
+    
+    Raises:
+        ValueError: If the configuration is invalid or defines no pipeline
+    """
+    raw = RAW_CONFIG_ADAPTER.validate_python(_intern_keys(data))
+    if not raw:
+        raise ValueError("Configuration must define a pipeline")
+    return raw
+
+def get_extensions(raw: Dict[str, RawPipelineBody]) -> Dict[str, Any]:
+    """Get all extensions from a raw configuration validated by load_raw_config"""
+    # Copy the body in one C-level call and drop core, the configuration is left as is
+    extensions = dict(next(iter(raw.values())))
+    extensions.pop(_CORE, None)
+    return extensions